@@ -1,6 +1,7 @@
 # bisection_search.py
+import asyncio
 import numpy as np
-from typing import Callable
+from typing import Awaitable, Callable, Optional, Tuple
 
 
 def bisection_search(
@@ -37,3 +38,260 @@ def bisection_search(
     raise ValueError(
         "Bisection method did not converge within the maximum number of iterations."
     )
+
+
+def bisection_search_batch(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: np.ndarray,
+    b: np.ndarray,
+    tol: float = 1e-8,
+    max_iterations: int = 1000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bisection method applied to many independent brackets at once.
+
+    Every lane follows exactly the same rules as `bisection_search`, but each
+    iteration evaluates `f` once on the full array of midpoints, so `f` may
+    rely on per-lane parameters aligned with `a` and `b`. Lanes that have
+    converged are frozen at their root by a convergence mask.
+
+    Args:
+        f (Callable[[np.ndarray], np.ndarray]): Vectorized function, evaluated elementwise.
+        a (np.ndarray): Left endpoints of the brackets.
+        b (np.ndarray): Right endpoints of the brackets (broadcast against a).
+        tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The roots and the number of iterations
+        each lane needed (0 for lanes whose root is an endpoint).
+
+    Raises:
+        ValueError: If f does not change sign on any of the brackets.
+        ValueError: If some lane does not converge within the maximum number of iterations.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    a = a.copy()
+    b = b.copy()
+    fa = np.asarray(f(a), dtype=float)
+    fb = np.asarray(f(b), dtype=float)
+
+    roots = np.full(a.shape, np.nan)
+    iterations = np.zeros(a.shape, dtype=int)
+
+    # Check if either endpoint is a root
+    left_root = np.abs(fa) < tol
+    right_root = ~left_root & (np.abs(fb) < tol)
+    roots[left_root] = a[left_root]
+    roots[right_root] = b[right_root]
+
+    active = ~(left_root | right_root)
+    if np.any(fa[active] * fb[active] > 0):
+        raise ValueError("Function must have opposite signs at endpoints a and b.")
+
+    # Collapse the brackets of finished lanes onto their root
+    a[~active] = roots[~active]
+    b[~active] = roots[~active]
+
+    for iteration in range(1, max_iterations + 1):
+        if not np.any(active):
+            break
+        c = (a + b) / 2
+        fc = np.asarray(f(c), dtype=float)
+
+        done = active & ((np.abs(fc) < tol) | ((b - a) / 2 < tol))
+        roots[done] = c[done]
+        iterations[done] = iteration
+        active &= ~done
+
+        left = active & (fa * fc < 0)
+        right = active & ~left
+        b[left] = c[left]
+        a[right] = c[right]
+        fa[right] = fc[right]
+
+    if np.any(active):
+        raise ValueError(
+            "Bisection method did not converge within the maximum number of iterations."
+        )
+
+    return roots, iterations
+
+
+def _golden_minimize_batch(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: np.ndarray,
+    b: np.ndarray,
+    tol: float,
+    max_iterations: int,
+) -> np.ndarray:
+    """Golden-section minimization of |f| on many intervals, one call to f per iteration."""
+    gr = (np.sqrt(5) + 1) / 2
+    a = a.copy()
+    b = b.copy()
+    c = b - (b - a) / gr
+    d = a + (b - a) / gr
+    fc = np.abs(f(c))
+    fd = np.abs(f(d))
+    for _ in range(max_iterations):
+        if np.all(b - a < tol):
+            break
+        # Keep [a, d] where f(c) < f(d) and [c, b] elsewhere; one interior
+        # point carries over, so only the other one is evaluated.
+        left = fc < fd
+        b = np.where(left, d, b)
+        a = np.where(left, a, c)
+        c, d = (
+            np.where(left, b - (b - a) / gr, d),
+            np.where(left, c, a + (b - a) / gr),
+        )
+        f_new = np.abs(f(np.where(left, c, d)))
+        fc, fd = np.where(left, f_new, fd), np.where(left, fc, f_new)
+    return (a + b) / 2
+
+
+def find_all_roots(
+    f: Callable[[np.ndarray], np.ndarray],
+    a: float,
+    b: float,
+    n_scan: int = 1000,
+    tol: float = 1e-8,
+    max_iterations: int = 1000,
+) -> np.ndarray:
+    """
+    Find all roots of f on [a, b] that are resolved by a grid of n_scan points.
+
+    f is sampled on the grid in a single vectorized call. Every sign change
+    between neighbouring samples becomes a bracket, and all brackets are refined
+    at once with `bisection_search_batch`. Local minima of |f| without a sign
+    change (touching roots such as those of (x - 1)^2) are refined with a batched
+    golden-section search and kept if |f| falls below tol there.
+
+    Args:
+        f (Callable[[np.ndarray], np.ndarray]): Vectorized function, evaluated elementwise.
+        a (float): Left end of the scanned interval.
+        b (float): Right end of the scanned interval.
+        n_scan (int, optional): Number of grid points. Defaults to 1000.
+        tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+
+    Returns:
+        np.ndarray: The sorted roots found on [a, b].
+    """
+    x = np.linspace(a, b, n_scan)
+    y = np.asarray(f(x), dtype=float)
+
+    exact = y == 0
+    sign_change = y[:-1] * y[1:] < 0
+    roots = [x[exact]]
+
+    if np.any(sign_change):
+        lanes = np.flatnonzero(sign_change)
+        bracket_roots, _ = bisection_search_batch(
+            f, x[lanes], x[lanes + 1], tol, max_iterations
+        )
+        roots.append(bracket_roots)
+
+    # Interior local minima of |y| that are not next to a sign change or an exact zero
+    magnitude = np.abs(y)
+    minimum = np.zeros_like(exact)
+    minimum[1:-1] = (
+        (magnitude[1:-1] < magnitude[:-2])
+        & (magnitude[1:-1] <= magnitude[2:])
+        & ~exact[1:-1]
+        & ~sign_change[:-1]
+        & ~sign_change[1:]
+    )
+    if np.any(minimum):
+        lanes = np.flatnonzero(minimum)
+        candidates = _golden_minimize_batch(
+            f, x[lanes - 1], x[lanes + 1], tol, max_iterations
+        )
+        touching = np.abs(np.asarray(f(candidates), dtype=float)) < tol
+        roots.append(candidates[touching])
+
+    return np.sort(np.concatenate(roots))
+
+
+async def bisection_search_async(
+    f: Callable[[float], Awaitable[float]],
+    a: float,
+    b: float,
+    k: int = 4,
+    tol: float = 1e-8,
+    max_iterations: int = 1000,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> float:
+    """
+    K-section search for a coroutine function f whose evaluations are slow.
+
+    Each round splits the bracket into k + 1 sub-intervals and awaits the k
+    interior evaluations concurrently, shrinking the bracket by a factor of
+    k + 1 per round instead of 2. With k = 1 this is the bisection method.
+
+    Args:
+        f (Callable[[float], Awaitable[float]]): Coroutine function for which to find the root.
+        a (float): Left endpoint of the bracket.
+        b (float): Right endpoint of the bracket.
+        k (int, optional): Number of concurrent evaluations per round. Defaults to 4.
+        tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of rounds. Defaults to 1000.
+        max_concurrency (Optional[int], optional): Maximum number of evaluations in
+            flight at once. Defaults to None (no limit beyond k).
+        timeout (Optional[float], optional): Seconds to wait for a round of
+            evaluations before cancelling it. Defaults to None.
+
+    Returns:
+        float: The estimated root of the function.
+
+    Raises:
+        ValueError: If f does not have opposite signs at a and b, or k is below 1.
+        ValueError: If the method does not converge within the maximum number of rounds.
+        asyncio.TimeoutError: If a round of evaluations exceeds the timeout.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1.")
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def evaluate(x: float) -> float:
+        if semaphore is None:
+            return await f(x)
+        async with semaphore:
+            return await f(x)
+
+    async def evaluate_all(points: np.ndarray) -> np.ndarray:
+        values = asyncio.gather(*(evaluate(x) for x in points))
+        return np.array(await asyncio.wait_for(values, timeout), dtype=float)
+
+    fa, fb = await evaluate_all(np.array([a, b], dtype=float))
+
+    # Check if either endpoint is a root
+    if np.abs(fa) < tol:
+        return a
+    if np.abs(fb) < tol:
+        return b
+
+    if fa * fb > 0:
+        raise ValueError("Function must have opposite signs at endpoints a and b.")
+
+    for _ in range(max_iterations):
+        points = a + (b - a) * np.arange(1, k + 1) / (k + 1)
+        values = await evaluate_all(points)
+
+        roots = np.flatnonzero(np.abs(values) < tol)
+        if roots.size:
+            return points[roots[0]]
+
+        # Keep the first sub-interval on which f changes sign
+        xs = np.concatenate(([a], points, [b]))
+        fs = np.concatenate(([fa], values, [fb]))
+        i = np.flatnonzero(fs[:-1] * fs[1:] < 0)[0]
+        a, b, fa, fb = xs[i], xs[i + 1], fs[i], fs[i + 1]
+
+        if (b - a) / 2 < tol:
+            return (a + b) / 2
+
+    raise ValueError(
+        "K-section method did not converge within the maximum number of iterations."
+    )
@@ -1,7 +1,13 @@
 # test_bisection_search.py
+import asyncio
 import pytest
 import numpy as np
-from ..implementation.bisection_search import bisection_search
+from ..implementation.bisection_search import (
+    bisection_search,
+    bisection_search_async,
+    bisection_search_batch,
+    find_all_roots,
+)
 
 
 def test_bisection_linear():
@@ -120,3 +126,151 @@ def test_bisection_tight_tolerance():
     root = bisection_search(f, a, b, tol=1e-12)
     expected = np.sqrt(3)
     assert np.isclose(root, expected, atol=1e-12)
+
+
+def test_bisection_batch_matches_scalar():
+    f = lambda x: x ** 3 - 2 * x - 5
+    a = np.array([2.0, 1.5, 0.0])
+    b = np.array([3.0, 2.5, 4.0])
+    roots, iterations = bisection_search_batch(f, a, b)
+    expected = [bisection_search(f, lo, hi) for lo, hi in zip(a, b)]
+    assert np.allclose(roots, expected)
+    assert np.all(iterations > 0)
+
+
+def test_bisection_batch_many_lanes():
+    targets = np.linspace(1.0, 100.0, 10000)
+    calls = []
+
+    def f(x):
+        calls.append(x.shape)
+        return x ** 2 - targets
+
+    roots, iterations = bisection_search_batch(
+        f, np.zeros_like(targets), np.full_like(targets, 11.0)
+    )
+    assert np.allclose(roots, np.sqrt(targets), atol=1e-7)
+    assert len(calls) == iterations.max() + 2
+    assert all(shape == targets.shape for shape in calls)
+
+
+def test_bisection_batch_endpoint_roots():
+    f = lambda x: x - 2
+    roots, iterations = bisection_search_batch(f, [2.0, 0.0], [3.0, 2.0])
+    assert np.allclose(roots, [2.0, 2.0])
+    assert np.array_equal(iterations, [0, 0])
+
+
+def test_bisection_batch_broadcast_shape():
+    f = lambda x: x ** 2 - 2
+    roots, iterations = bisection_search_batch(f, np.zeros((2, 3)), 2.0)
+    assert roots.shape == (2, 3)
+    assert iterations.shape == (2, 3)
+    assert np.allclose(roots, np.sqrt(2))
+
+
+def test_bisection_batch_no_root():
+    f = lambda x: x ** 2 + 1
+    with pytest.raises(ValueError):
+        bisection_search_batch(f, [0.0, -1.0], [1.0, 1.0])
+
+
+def test_bisection_batch_max_iterations():
+    f = lambda x: x - 1
+    with pytest.raises(ValueError):
+        bisection_search_batch(f, [0.0], [2.5], max_iterations=0)
+
+
+def test_find_all_roots_sin():
+    roots = find_all_roots(np.sin, 0.5, 20)
+    expected = np.pi * np.arange(1, 7)
+    assert np.allclose(roots, expected, atol=1e-8)
+
+
+def test_find_all_roots_single_call_scan():
+    calls = []
+
+    def f(x):
+        calls.append(np.shape(x))
+        return np.cos(x)
+
+    roots = find_all_roots(f, 0, 10, n_scan=500)
+    assert np.allclose(roots, np.pi / 2 + np.pi * np.arange(3), atol=1e-8)
+    assert calls[0] == (500,)
+
+
+def test_find_all_roots_touching_root():
+    f = lambda x: (x - 1) ** 2 * (x + 2)
+    roots = find_all_roots(f, -3, 3, n_scan=101)
+    assert roots.size == 2
+    assert np.isclose(roots[0], -2.0, atol=1e-8)
+    assert np.isclose(roots[1], 1.0, atol=1e-4)
+
+
+def test_find_all_roots_grid_point_root():
+    f = lambda x: x * (x - 0.5)
+    roots = find_all_roots(f, -1, 1, n_scan=5)
+    assert np.allclose(roots, [0.0, 0.5])
+
+
+def test_find_all_roots_no_roots():
+    f = lambda x: x ** 2 + 1
+    roots = find_all_roots(f, -2, 2)
+    assert roots.size == 0
+
+
+def make_async(f, delay=0.0, log=None):
+    async def wrapper(x):
+        if log is not None:
+            log.append(x)
+        await asyncio.sleep(delay)
+        return f(x)
+
+    return wrapper
+
+
+@pytest.mark.parametrize("k", [1, 3, 7])
+def test_bisection_async_roots(k):
+    f = make_async(lambda x: x ** 3 - 2)
+    root = asyncio.run(bisection_search_async(f, 1, 2, k=k, tol=1e-10))
+    assert np.isclose(root, 2 ** (1.0 / 3), atol=1e-10)
+
+
+def test_bisection_async_fewer_rounds():
+    log = []
+    f = make_async(lambda x: x ** 2 - 2, log=log)
+    root = asyncio.run(bisection_search_async(f, 1, 2, k=7, tol=1e-9))
+    assert np.isclose(root, np.sqrt(2), atol=1e-9)
+    rounds = (len(log) - 2) // 7
+    # the bracket shrinks by 8 per round instead of 2
+    assert rounds <= np.ceil(np.log(1 / 1e-9) / np.log(8))
+
+
+def test_bisection_async_concurrency_limit():
+    in_flight = []
+    peak = []
+
+    async def f(x):
+        in_flight.append(x)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.001)
+        in_flight.remove(x)
+        return x - 0.3
+
+    root = asyncio.run(
+        bisection_search_async(f, 0, 1, k=8, tol=1e-6, max_concurrency=3)
+    )
+    assert np.isclose(root, 0.3, atol=1e-6)
+    assert max(peak) == 3
+
+
+def test_bisection_async_timeout():
+    f = make_async(lambda x: x - 0.3, delay=1.0)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(bisection_search_async(f, 0, 1, timeout=0.01))
+
+
+def test_bisection_async_no_root():
+    f = make_async(lambda x: x ** 2 + 1)
+    with pytest.raises(ValueError):
+        asyncio.run(bisection_search_async(f, 0, 1))
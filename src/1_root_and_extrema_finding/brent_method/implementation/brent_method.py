@@ -0,0 +1,97 @@
+# brent_method.py
+import numpy as np
+from typing import Callable, Tuple
+
+
+def brent_method(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    tol: float = 1e-8,
+    max_iterations: int = 1000,
+) -> Tuple[float, int]:
+    """
+    Brent's method for finding the root of a real-valued function on a bracket.
+
+    Combines inverse quadratic interpolation and secant steps with a bisection
+    fallback. The bracket is preserved on every step, so convergence is as
+    guaranteed as for bisection, while smooth functions converge superlinearly.
+
+    Args:
+        f (Callable[[float], float]): The function for which to find the root.
+        a (float): Left endpoint of the bracket.
+        b (float): Right endpoint of the bracket.
+        tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+
+    Returns:
+        Tuple[float, int]: The estimated root and the number of evaluations of f.
+
+    Raises:
+        ValueError: If f does not have opposite signs at a and b.
+        ValueError: If the method does not converge within the maximum number of iterations.
+    """
+    eps = np.finfo(float).eps
+    fa: float = f(a)
+    fb: float = f(b)
+    evaluations = 2
+
+    # Check if either endpoint is a root
+    if np.abs(fa) < tol:
+        return a, evaluations
+    if np.abs(fb) < tol:
+        return b, evaluations
+
+    if fa * fb > 0:
+        raise ValueError("Function must have opposite signs at endpoints a and b.")
+
+    # b is the current estimate, c the contrapoint (f(b) and f(c) differ in
+    # sign) and a the previous estimate.
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iterations):
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if np.abs(fc) < np.abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * eps * np.abs(b) + tol / 2
+        xm = (c - b) / 2
+        if np.abs(xm) <= tol1 or np.abs(fb) < tol:
+            return b, evaluations
+
+        if np.abs(e) >= tol1 and np.abs(fa) > np.abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = np.abs(p)
+            # Accept the interpolation only if it stays well inside the bracket
+            # and the steps keep shrinking, otherwise bisect.
+            if 2 * p < min(3 * xm * q - np.abs(tol1 * q), np.abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a, fa = b, fb
+        b += d if np.abs(d) > tol1 else np.copysign(tol1, xm)
+        fb = f(b)
+        evaluations += 1
+
+    raise ValueError(
+        "Brent's method did not converge within the maximum number of iterations."
+    )
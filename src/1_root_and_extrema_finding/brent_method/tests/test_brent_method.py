@@ -0,0 +1,77 @@
+# test_brent_method.py
+import pytest
+import numpy as np
+from scipy.optimize import brentq
+from ..implementation.brent_method import brent_method
+
+
+def counted(f):
+    def wrapper(x):
+        wrapper.calls += 1
+        return f(x)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+def test_brent_linear():
+    f = lambda x: 2 * x - 4
+    root, _ = brent_method(f, 0, 5)
+    assert np.isclose(root, 2.0)
+
+
+def test_brent_quadratic():
+    f = lambda x: x ** 2 - 4
+    root, _ = brent_method(f, 0, 3)
+    assert np.isclose(root, 2.0)
+
+
+def test_brent_sin():
+    root, _ = brent_method(np.sin, 3, 4)
+    assert np.isclose(root, np.pi, atol=1e-8)
+
+
+def test_brent_no_root():
+    f = lambda x: x ** 2 + 1
+    with pytest.raises(ValueError):
+        brent_method(f, 0, 1)
+
+
+def test_brent_max_iterations():
+    f = lambda x: x - 1
+    with pytest.raises(ValueError):
+        brent_method(f, 0, 2.5, max_iterations=0)
+
+
+def test_brent_endpoint_root():
+    f = lambda x: x - 2
+    root, evaluations = brent_method(f, 2, 3)
+    assert root == 2
+    assert evaluations == 2
+
+
+def test_brent_reports_evaluations():
+    f = counted(lambda x: np.exp(x) - 2)
+    root, evaluations = brent_method(f, 0, 1)
+    assert np.isclose(root, np.log(2), atol=1e-8)
+    assert evaluations == f.calls
+
+
+def test_brent_fewer_evaluations_than_bisection():
+    f = lambda x: x ** 3 - 2 * x - 5
+    _, evaluations = brent_method(f, 2, 3, tol=1e-10)
+    # bisection needs about log2((b - a) / tol) + 2 evaluations
+    bisection_evaluations = int(np.ceil(np.log2(1 / 1e-10))) + 2
+    assert 3 * evaluations < bisection_evaluations
+
+
+def test_brent_matches_scipy():
+    f = lambda x: np.cos(x) - x ** 3
+    root, _ = brent_method(f, 0, 1, tol=1e-12)
+    assert np.isclose(root, brentq(f, 0, 1, xtol=1e-12), atol=1e-12)
+
+
+def test_brent_flat_function():
+    f = lambda x: (x - 1) ** 5
+    root, _ = brent_method(f, 0, 3, tol=1e-12)
+    assert np.isclose(root, 1.0, atol=1e-2)
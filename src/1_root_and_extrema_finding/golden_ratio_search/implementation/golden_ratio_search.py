@@ -1,5 +1,67 @@
 import numpy as np
-from typing import Callable
+from typing import Callable, Tuple, Union
+
+
+def _brent_minimize(
+    f: Callable[[float], float], a: float, b: float, tol: float, max_iterations: int
+) -> Tuple[float, int]:
+    """Brent's minimization: golden-section steps accelerated by parabolic interpolation."""
+    c_gold = (3 - np.sqrt(5)) / 2
+    sqrt_eps = np.sqrt(np.finfo(float).eps)
+    x = w = v = a + c_gold * (b - a)
+    fx = fw = fv = f(x)
+    evaluations = 1
+    d = e = 0.0
+    for _ in range(max_iterations):
+        m = (a + b) / 2
+        tol1 = sqrt_eps * np.abs(x) + tol / 3
+        tol2 = 2 * tol1
+        if np.abs(x - m) <= tol2 - (b - a) / 2:
+            return x, evaluations
+        parabolic = False
+        if np.abs(e) > tol1:
+            # Fit a parabola through x, w and v
+            r = (x - w) * (fx - fv)
+            q = (x - v) * (fx - fw)
+            p = (x - v) * q - (x - w) * r
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = np.abs(q)
+            e_previous, e = e, d
+            # Accept the parabolic step only if it falls inside the bracket and
+            # is less than half the step before last
+            if np.abs(p) < np.abs(q * e_previous / 2) and q * (a - x) < p < q * (b - x):
+                d = p / q
+                parabolic = True
+                if (x + d) - a < tol2 or b - (x + d) < tol2:
+                    d = np.copysign(tol1, m - x)
+        if not parabolic:
+            e = (a if x >= m else b) - x
+            d = c_gold * e
+        u = x + d if np.abs(d) >= tol1 else x + np.copysign(tol1, d)
+        fu = f(u)
+        evaluations += 1
+        if fu <= fx:
+            if u >= x:
+                a = x
+            else:
+                b = x
+            v, w, x = w, x, u
+            fv, fw, fx = fw, fx, fu
+        else:
+            if u < x:
+                a = u
+            else:
+                b = u
+            if fu <= fw or w == x:
+                v, w = w, u
+                fv, fw = fw, fu
+            elif fu <= fv or v == x or v == w:
+                v, fv = u, fu
+    raise ValueError(
+        "Brent's method did not converge within the maximum number of iterations."
+    )
 
 
 def golden_ratio_search(
@@ -8,25 +70,41 @@ def golden_ratio_search(
     b: float,
     tol: float = 1e-8,
     max_iterations: int = 1000,
-) -> float:
+    method: str = "golden",
+    return_evaluations: bool = False,
+) -> Union[float, Tuple[float, int]]:
+    if method not in ("golden", "brent"):
+        raise ValueError(f"Unknown method '{method}'.")
     f_mod = lambda x: (f(x)) ** 2
+    if method == "brent":
+        x, evaluations = _brent_minimize(f_mod, a, b, tol, max_iterations)
+        return (x, evaluations) if return_evaluations else x
+
     gr = (np.sqrt(5) + 1) / 2
     c = b - (b - a) / gr
     d = a + (b - a) / gr
+    # One of the interior points carries over to the next iteration, so only
+    # the new point has to be evaluated.
+    fc = f_mod(c)
+    fd = f_mod(d)
+    evaluations = 2
     for _ in range(max_iterations):
-        fc = f_mod(c)
-        fd = f_mod(d)
         if fc < fd:
-            b, d = d, c
+            b, d, fd = d, c, fc
             c = b - (b - a) / gr
+            fc = f_mod(c)
         elif fc > fd:
-            a, c = c, d
+            a, c, fc = c, d, fd
             d = a + (b - a) / gr
+            fd = f_mod(d)
         else:
             # If fc == fd, return the midpoint
-            return (a + b) / 2
+            x = (a + b) / 2
+            return (x, evaluations) if return_evaluations else x
+        evaluations += 1
         if np.abs(b - a) < tol:
-            return (b + a) / 2
+            x = (b + a) / 2
+            return (x, evaluations) if return_evaluations else x
     raise ValueError(
         "Golden ratio search did not converge within the maximum number of iterations."
     )
@@ -121,3 +121,54 @@ def test_golden_ratio_search_function_with_noise():
     root = golden_ratio_search(f, a, b)
     expected = 3.0
     assert np.isclose(root, expected, atol=1e-2)
+
+
+def test_golden_ratio_search_one_evaluation_per_iteration():
+    calls = []
+
+    def f(x):
+        calls.append(x)
+        return x - 2.5
+
+    root, evaluations = golden_ratio_search(f, 0, 5, return_evaluations=True)
+    assert np.isclose(root, 2.5, atol=1e-8)
+    assert evaluations == len(calls)
+    # the bracket shrinks by 1 / gr per evaluation
+    gr = (np.sqrt(5) + 1) / 2
+    assert evaluations <= np.ceil(np.log(5 / 1e-8) / np.log(gr)) + 2
+
+
+@pytest.mark.parametrize(
+    "f, a, b, expected",
+    [
+        (lambda x: 2 * x - 4, 0, 5, 2.0),
+        (lambda x: (x - 3) ** 2, 0, 6, 3.0),
+        (lambda x: np.sin(x), 3, 4, np.pi),
+        (lambda x: (x + 3) ** 2, -5, -1, -3.0),
+        (lambda x: (x - 100) ** 2, 90, 110, 100.0),
+    ],
+)
+def test_golden_ratio_search_brent(f, a, b, expected):
+    root = golden_ratio_search(f, a, b, method="brent")
+    assert np.isclose(root, expected, atol=1e-6)
+
+
+def test_golden_ratio_search_brent_fewer_evaluations():
+    f = lambda x: np.exp(x) - 2
+    root, brent_evaluations = golden_ratio_search(
+        f, 0, 2, method="brent", return_evaluations=True
+    )
+    _, golden_evaluations = golden_ratio_search(f, 0, 2, return_evaluations=True)
+    assert np.isclose(root, np.log(2), atol=1e-7)
+    assert 2 * brent_evaluations < golden_evaluations
+
+
+def test_golden_ratio_search_brent_max_iterations():
+    f = lambda x: (x - 2) ** 2
+    with pytest.raises(ValueError):
+        golden_ratio_search(f, 0, 4, method="brent", max_iterations=0)
+
+
+def test_golden_ratio_search_unknown_method():
+    with pytest.raises(ValueError):
+        golden_ratio_search(lambda x: x, 0, 1, method="fibonacci")
@@ -1,6 +1,32 @@
 # gradient_descent.py
 import numpy as np
-from typing import Callable
+from typing import Callable, Tuple
+
+
+def _armijo_backtracking(
+    f: Callable[[np.ndarray], float],
+    x: np.ndarray,
+    fx: float,
+    grad: np.ndarray,
+    step: np.ndarray,
+    trial: np.ndarray,
+    c: float = 1e-4,
+    shrink: float = 0.5,
+    max_backtracks: int = 50,
+) -> Tuple[float, float]:
+    """Shrink step until f decreases sufficiently; return the scale and f there."""
+    slope = np.vdot(grad, step)
+    t = 1.0
+    for backtrack in range(max_backtracks):
+        # shrink only before another trial, so f_trial always belongs to t
+        if backtrack:
+            t *= shrink
+        np.multiply(step, t, out=trial)
+        trial += x
+        f_trial = f(trial)
+        if f_trial <= fx + c * t * slope:
+            break
+    return t, f_trial
 
 
 def gradient_descent(
@@ -10,14 +36,104 @@ def gradient_descent(
     learning_rate: float = 0.01,
     tol: float = 1e-6,
     max_iterations: int = 1000,
+    method: str = "gd",
+    momentum: float = 0.9,
+    beta1: float = 0.9,
+    beta2: float = 0.999,
+    epsilon: float = 1e-8,
+    line_search: bool = False,
 ) -> np.ndarray:
+    """
+    Minimize f by gradient descent with a selectable update rule.
+
+    - "gd": x -= learning_rate * g
+    - "momentum": heavy-ball, v = momentum * v - learning_rate * g; x += v
+    - "nesterov": as momentum, with g evaluated at the look-ahead point x + momentum * v
+    - "adam": bias-corrected first and second moment estimates (beta1, beta2, epsilon)
+    - "barzilai_borwein": x -= alpha * g with alpha = s.s / s.y from the last step
+
+    With line_search=True the step proposed by the rule is shortened by Armijo
+    backtracking until f decreases sufficiently; if it is not a descent direction,
+    the accumulated momentum is discarded and -learning_rate * g is used instead.
+    All state lives in buffers allocated once, and x is updated in place.
+    """
+    methods = ("gd", "momentum", "nesterov", "adam", "barzilai_borwein")
+    if method not in methods:
+        raise ValueError(f"Unknown method '{method}'.")
+    if line_search and method == "nesterov":
+        raise ValueError(
+            "Line search needs the gradient at x, which Nesterov does not evaluate."
+        )
+
     x = x0.astype(float)
-    for _ in range(max_iterations):
-        grad = grad_f(x)
+    step = np.zeros_like(x)
+    velocity = np.zeros_like(x)
+    if method == "nesterov":
+        lookahead = np.empty_like(x)
+    if method == "adam":
+        second_moment = np.zeros_like(x)
+        scaled = np.empty_like(x)
+    if method == "barzilai_borwein":
+        x_previous = np.empty_like(x)
+        grad_previous = np.empty_like(x)
+    if line_search:
+        trial = np.empty_like(x)
+        fx = f(x)
+
+    for iteration in range(1, max_iterations + 1):
+        if method == "nesterov":
+            np.multiply(velocity, momentum, out=lookahead)
+            lookahead += x
+            grad = grad_f(lookahead)
+        else:
+            grad = grad_f(x)
         grad_norm = np.linalg.norm(grad, ord=2)
         if grad_norm < tol:
             return x
-        x = x - learning_rate * grad
+
+        if method == "gd":
+            np.multiply(grad, -learning_rate, out=step)
+        elif method in ("momentum", "nesterov"):
+            velocity *= momentum
+            np.multiply(grad, learning_rate, out=step)
+            velocity -= step
+            step[...] = velocity
+        elif method == "adam":
+            velocity *= beta1
+            np.multiply(grad, 1 - beta1, out=scaled)
+            velocity += scaled
+            second_moment *= beta2
+            np.multiply(grad, grad, out=scaled)
+            scaled *= 1 - beta2
+            second_moment += scaled
+            np.divide(second_moment, 1 - beta2 ** iteration, out=scaled)
+            np.sqrt(scaled, out=scaled)
+            scaled += epsilon
+            np.divide(velocity, scaled, out=step)
+            step *= -learning_rate / (1 - beta1 ** iteration)
+        else:
+            rate = learning_rate
+            if iteration > 1:
+                x_previous -= x
+                grad_previous -= grad
+                # s.y with s = x - x_previous and y = grad - grad_previous
+                sy = np.vdot(x_previous, grad_previous)
+                if sy > 0:
+                    rate = np.vdot(x_previous, x_previous) / sy
+            x_previous[...] = x
+            grad_previous[...] = grad
+            np.multiply(grad, -rate, out=step)
+
+        if line_search:
+            if np.vdot(grad, step) >= 0:
+                velocity[...] = 0
+                np.multiply(grad, -learning_rate, out=step)
+            t, fx = _armijo_backtracking(f, x, fx, grad, step, trial)
+            if t != 1.0:
+                step *= t
+                if method == "momentum":
+                    velocity[...] = step
+        x += step
     raise ValueError(
         "Gradient descent did not converge within the maximum number of iterations."
     )
@@ -1,7 +1,7 @@
 # test_gradient_descent.py
 import pytest
 import numpy as np
-from ..implementation.gradient_descent import gradient_descent
+from ..implementation.gradient_descent import _armijo_backtracking, gradient_descent
 
 
 def test_gradient_descent_quadratic():
@@ -153,3 +153,119 @@ def test_gradient_descent_already_at_minimum():
     x = gradient_descent(f, grad_f, x0, learning_rate=0.1, tol=1e-6)
     expected = np.array([0.0, 0.0])
     assert np.allclose(x, expected, atol=1e-6)
+
+
+def _ill_conditioned_quadratic(n=50, condition=1000.0):
+    d = np.logspace(0, np.log10(condition), n)
+    f = lambda x: 0.5 * np.sum(d * x ** 2)
+    grad_f = lambda x: d * x
+    return f, grad_f, d
+
+
+def test_gradient_descent_ill_conditioned_plain_fails():
+    f, grad_f, d = _ill_conditioned_quadratic()
+    x0 = np.ones_like(d)
+    with pytest.raises(ValueError):
+        gradient_descent(f, grad_f, x0, learning_rate=1 / d.max(), max_iterations=2000)
+
+
+@pytest.mark.parametrize(
+    "method, options",
+    [
+        ("momentum", {"learning_rate": 1e-3, "momentum": 0.9}),
+        ("nesterov", {"learning_rate": 1e-3, "momentum": 0.9}),
+        ("barzilai_borwein", {"learning_rate": 1e-3}),
+        ("momentum", {"learning_rate": 1e-3, "line_search": True}),
+        ("barzilai_borwein", {"learning_rate": 1e-3, "line_search": True}),
+    ],
+)
+def test_gradient_descent_ill_conditioned_methods(method, options):
+    f, grad_f, d = _ill_conditioned_quadratic()
+    x0 = np.ones_like(d)
+    x = gradient_descent(
+        f, grad_f, x0, tol=1e-6, max_iterations=2000, method=method, **options
+    )
+    assert np.allclose(x, 0.0, atol=1e-5)
+    assert np.all(x0 == 1.0)
+
+
+def test_gradient_descent_adam():
+    f = lambda x: np.sum((x - 1) ** 2)
+    grad_f = lambda x: 2 * (x - 1)
+    x0 = np.array([5.0, -3.0, 7.0])
+    x = gradient_descent(
+        f, grad_f, x0, learning_rate=0.1, tol=1e-6, max_iterations=5000, method="adam"
+    )
+    assert np.allclose(x, 1.0, atol=1e-5)
+
+
+def test_gradient_descent_fewer_gradient_evaluations():
+    f, grad_f, d = _ill_conditioned_quadratic(condition=100.0)
+    calls = []
+
+    def counted_grad(x):
+        calls.append(1)
+        return grad_f(x)
+
+    x0 = np.ones_like(d)
+    rate = 1 / d.max()
+    gradient_descent(f, counted_grad, x0, learning_rate=rate, max_iterations=10000)
+    plain = len(calls)
+    calls.clear()
+    gradient_descent(f, counted_grad, x0, learning_rate=rate, method="barzilai_borwein")
+    assert 5 * len(calls) < plain
+
+
+def test_gradient_descent_rosenbrock_line_search():
+    f = lambda x: (1 - x[0]) ** 2 + 100 * (x[1] - x[0] ** 2) ** 2
+    grad_f = lambda x: np.array(
+        [-2 * (1 - x[0]) - 400 * x[0] * (x[1] - x[0] ** 2), 200 * (x[1] - x[0] ** 2)]
+    )
+    x = gradient_descent(
+        f,
+        grad_f,
+        np.array([-1.2, 1.0]),
+        learning_rate=1e-3,
+        tol=1e-6,
+        max_iterations=20000,
+        method="barzilai_borwein",
+        line_search=True,
+    )
+    assert np.allclose(x, [1.0, 1.0], atol=1e-4)
+
+
+def test_gradient_descent_unknown_method():
+    with pytest.raises(ValueError):
+        gradient_descent(lambda x: 0.0, lambda x: x, np.ones(2), method="lbfgs")
+
+
+def test_gradient_descent_nesterov_line_search():
+    with pytest.raises(ValueError):
+        gradient_descent(
+            lambda x: 0.0, lambda x: x, np.ones(2), method="nesterov", line_search=True
+        )
+
+
+def test_gradient_descent_line_search_large_learning_rate():
+    f = lambda x: np.sum((x - 1) ** 2)
+    grad_f = lambda x: 2 * (x - 1)
+    x0 = np.array([5.0, -3.0, 7.0])
+    with pytest.raises(ValueError):
+        gradient_descent(f, grad_f, x0, learning_rate=1.5, max_iterations=100)
+    x = gradient_descent(
+        f, grad_f, x0, learning_rate=1.5, max_iterations=100, line_search=True
+    )
+    assert np.allclose(x, 1.0, atol=1e-6)
+
+
+def test_armijo_backtracking_out_of_backtracks():
+    f = lambda x: np.sum(x ** 2)
+    x = np.array([1.0])
+    grad = 2 * x
+    step = np.array([-20.0])
+    trial = np.empty_like(x)
+    t, f_trial = _armijo_backtracking(f, x, f(x), grad, step, trial, max_backtracks=3)
+    # no trial is accepted: 1, 0.5 and 0.25 all overshoot the minimum
+    assert t == 0.25
+    assert f_trial == f(x + t * step)
+    assert np.array_equal(trial, x + t * step)
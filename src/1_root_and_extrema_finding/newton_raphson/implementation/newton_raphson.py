@@ -1,6 +1,17 @@
 # newton_raphson.py
+import inspect
+import warnings
 import numpy as np
-from typing import Callable, Optional
+import scipy.sparse as sp
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from scipy.sparse.linalg import gmres, splu
+from typing import Callable, Dict, Optional, Tuple, Union
+
+# Status codes reported per lane by newton_raphson_batch
+CONVERGED = 0
+ZERO_DERIVATIVE = 1
+NOT_CONVERGED = 2
+NOT_FINITE = 3
 
 
 def newton_raphson(
@@ -42,45 +53,219 @@ def newton_raphson(
     )
 
 
+def newton_raphson_batch(
+    f: Callable[..., np.ndarray],
+    df: Callable[..., np.ndarray],
+    x0: np.ndarray,
+    tol: float = 1e-8,
+    max_iterations: int = 1000,
+    args: Tuple[np.ndarray, ...] = (),
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Newton-Raphson method applied to an array of independent initial guesses.
+
+    On every iteration f and df are called once, on the lanes that are still
+    active only. Lanes that converge are frozen, and lanes that fail are set to
+    NaN and flagged instead of aborting the whole batch.
+
+    Args:
+        f (Callable[..., np.ndarray]): Vectorized function, called as f(x, *args).
+        df (Callable[..., np.ndarray]): Vectorized derivative, called as df(x, *args).
+        x0 (np.ndarray): Initial guesses, one per lane.
+        tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+        args (Tuple[np.ndarray, ...], optional): Per-lane parameters broadcast against x0.
+            They are sliced together with x so that f and df see matching lanes.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The estimated roots (NaN for failed lanes) and
+        the status of every lane: CONVERGED, ZERO_DERIVATIVE, NOT_CONVERGED or NOT_FINITE.
+    """
+    x = np.array(x0, dtype=float)
+    shape = x.shape
+    x = x.ravel()
+    args = tuple(np.broadcast_to(np.asarray(arg), shape).ravel() for arg in args)
+
+    status = np.full(x.shape, NOT_CONVERGED)
+    lanes = np.arange(x.size)
+    for _ in range(max_iterations):
+        if lanes.size == 0:
+            break
+        xa = x[lanes]
+        lane_args = tuple(arg[lanes] for arg in args)
+        fx = np.asarray(f(xa, *lane_args), dtype=float)
+        dfx = np.asarray(df(xa, *lane_args), dtype=float)
+
+        zero = np.isclose(dfx, 0.0, atol=1e-12)
+        step = np.divide(fx, dfx, out=np.zeros_like(xa), where=~zero)
+        x_new = xa - step
+        not_finite = ~zero & ~np.isfinite(x_new)
+        converged = ~zero & ~not_finite & (np.abs(x_new - xa) < tol)
+
+        failed = zero | not_finite
+        x[lanes] = np.where(failed, np.nan, x_new)
+        status[lanes[zero]] = ZERO_DERIVATIVE
+        status[lanes[not_finite]] = NOT_FINITE
+        status[lanes[converged]] = CONVERGED
+        lanes = lanes[~(failed | converged)]
+
+    x[lanes] = np.nan
+    return x.reshape(shape), status.reshape(shape)
+
+
+# The relative tolerance of gmres was renamed from tol to rtol in SciPy 1.12
+_GMRES_RTOL = "rtol" if "rtol" in inspect.signature(gmres).parameters else "tol"
+
+
+def _factorize_jacobian(
+    Jx, iteration: int, x: np.ndarray, linear_solver: str, gmres_tol: float
+) -> Tuple[Callable[[np.ndarray], np.ndarray], bool]:
+    """
+    Prepare a function solving Jx @ delta = rhs.
+
+    Returns the solver and whether a factorization was computed. Dense Jacobians
+    are LU-factored, sparse ones use a sparse LU, and with the "gmres" solver the
+    system is only solved approximately, without any factorization.
+    """
+    if linear_solver == "gmres":
+
+        def solve(rhs: np.ndarray) -> np.ndarray:
+            delta, status = gmres(Jx, rhs, atol=0.0, **{_GMRES_RTOL: gmres_tol})
+            if status < 0:
+                raise ValueError(f"GMRES breakdown at iteration {iteration}, x = {x}.")
+            return delta
+
+        return solve, False
+
+    if sp.issparse(Jx):
+        try:
+            lu = splu(sp.csc_matrix(Jx, dtype=float))
+        except RuntimeError:
+            raise ValueError(f"Jacobian is singular at iteration {iteration}, x = {x}.")
+        return lu.solve, True
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        lu, piv = lu_factor(np.asarray(Jx, dtype=float))
+    if not np.all(np.isfinite(lu)) or np.any(np.diag(lu) == 0):
+        raise ValueError(f"Jacobian is singular at iteration {iteration}, x = {x}.")
+    return (lambda rhs: lu_solve((lu, piv), rhs)), True
+
+
 def newton_raphson_system(
     F: Callable[[np.ndarray], np.ndarray],
     J: Callable[[np.ndarray], np.ndarray],
     x0: Optional[np.ndarray] = None,
     tol: float = 1e-8,
     max_iterations: int = 1000,
-) -> np.ndarray:
+    strategy: str = "newton",
+    jacobian_refresh: int = 10,
+    stall_ratio: float = 0.5,
+    linear_solver: str = "direct",
+    gmres_tol: float = 1e-6,
+    return_info: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, int]]]:
     """
     Newton-Raphson method for finding the root of a system of nonlinear equations.
 
+    The Jacobian is LU-factored and, depending on the strategy, reused across steps:
+
+    - "newton": evaluate and factor J on every iteration.
+    - "chord": reuse the factorization for `jacobian_refresh` steps (Shamanskii method).
+    - "broyden": reuse the factorization and apply Broyden rank-one updates to its
+      inverse, for at most `jacobian_refresh` steps.
+
+    With "chord" and "broyden" the Jacobian is also refreshed as soon as a step fails
+    to reduce the residual norm by at least a factor of `stall_ratio`.
+
+    J may return a dense ndarray or a `scipy.sparse` matrix; the latter is factored
+    with a sparse LU. With linear_solver="gmres" each Newton step is instead solved
+    inexactly by GMRES (Newton-Krylov), and J may also return a
+    `scipy.sparse.linalg.LinearOperator`.
+
     Args:
         F (Callable[[np.ndarray], np.ndarray]): The system of functions.
         J (Callable[[np.ndarray], np.ndarray]): The Jacobian matrix of F.
         x0 (Optional[np.ndarray], optional): Initial guess for the roots. Defaults to None.
         tol (float, optional): Tolerance for convergence. Defaults to 1e-8.
         max_iterations (int, optional): Maximum number of iterations. Defaults to 1000.
+        strategy (str, optional): "newton", "chord" or "broyden". Defaults to "newton".
+        jacobian_refresh (int, optional): Steps between Jacobian refreshes. Defaults to 10.
+        stall_ratio (float, optional): Residual reduction below which the Jacobian is
+            refreshed early. Defaults to 0.5.
+        linear_solver (str, optional): "direct" or "gmres". Defaults to "direct".
+        gmres_tol (float, optional): Relative residual tolerance of each GMRES solve.
+            Defaults to 1e-6.
+        return_info (bool, optional): Also return evaluation counts. Defaults to False.
 
     Returns:
-        np.ndarray: The estimated roots of the system.
+        np.ndarray: The estimated roots of the system. If return_info is True, a tuple
+        of the roots and a dict with the number of "iterations", "function_evaluations",
+        "jacobian_evaluations" and "factorizations".
 
     Raises:
         ValueError: If the Jacobian is singular at any iteration.
         ValueError: If the method does not converge within the maximum number of iterations.
         ValueError: If the initial guess x0 is not provided.
+        ValueError: If the strategy or the linear solver is unknown.
     """
     if x0 is None:
         raise ValueError("Initial guess x0 must be provided")
+    if strategy not in ("newton", "chord", "broyden"):
+        raise ValueError(f"Unknown strategy '{strategy}'.")
+    if linear_solver not in ("direct", "gmres"):
+        raise ValueError(f"Unknown linear solver '{linear_solver}'.")
+    info = {
+        "iterations": 0,
+        "function_evaluations": 0,
+        "jacobian_evaluations": 0,
+        "factorizations": 0,
+    }
     x = x0.astype(float)
+    Fx = F(x)
+    info["function_evaluations"] += 1
+    solve = None
+    steps_since_refresh = 0
+    # Broyden updates of the inverse in product form: H <- (I + w s^T / d) H
+    updates = []
     for iteration in range(1, max_iterations + 1):
-        Fx = F(x)
-        Jx = J(x)
-        try:
-            delta = np.linalg.solve(Jx, -Fx)
-        except np.linalg.LinAlgError:
-            raise ValueError(f"Jacobian is singular at iteration {iteration}, x = {x}.")
+        info["iterations"] = iteration
+        if (
+            solve is None
+            or strategy == "newton"
+            or steps_since_refresh >= jacobian_refresh
+        ):
+            Jx = J(x)
+            info["jacobian_evaluations"] += 1
+            solve, factorized = _factorize_jacobian(
+                Jx, iteration, x, linear_solver, gmres_tol
+            )
+            info["factorizations"] += factorized
+            steps_since_refresh = 0
+            updates = []
+
+        delta = solve(-Fx)
+        for w, s, d in updates:
+            delta += w * (s @ delta) / d
         x_new = x + delta
         if np.linalg.norm(delta, ord=np.inf) < tol:
-            return x_new
-        x = x_new
+            return (x_new, info) if return_info else x_new
+
+        F_new = F(x_new)
+        info["function_evaluations"] += 1
+        if strategy != "newton":
+            if np.linalg.norm(F_new) > stall_ratio * np.linalg.norm(Fx):
+                solve = None
+            elif strategy == "broyden":
+                # H y, where y = F_new - Fx and H is the current inverse
+                Hy = solve(F_new - Fx)
+                for w, s, d in updates:
+                    Hy += w * (s @ Hy) / d
+                d = delta @ Hy
+                if d != 0:
+                    updates.append((delta - Hy, delta, d))
+        x, Fx = x_new, F_new
+        steps_since_refresh += 1
     raise ValueError(
         "Newton-Raphson method did not converge within the maximum number of iterations."
     )
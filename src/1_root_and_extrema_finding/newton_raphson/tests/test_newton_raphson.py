@@ -1,7 +1,16 @@
 # test_newton_raphson.py
 import pytest
 import numpy as np
-from ..implementation.newton_raphson import newton_raphson, newton_raphson_system
+import scipy.sparse as sp
+from scipy.sparse.linalg import LinearOperator
+from ..implementation.newton_raphson import (
+    CONVERGED,
+    NOT_CONVERGED,
+    ZERO_DERIVATIVE,
+    newton_raphson,
+    newton_raphson_batch,
+    newton_raphson_system,
+)
 
 
 # Univariate Tests
@@ -95,6 +104,63 @@ def test_newton_raphson_initial_guess():
     assert np.isclose(root, expected, atol=1e-8)
 
 
+# Batched Tests
+
+
+def test_newton_raphson_batch_matches_scalar():
+    f = lambda x: x ** 3 - 6 * x ** 2 + 11 * x - 6
+    df = lambda x: 3 * x ** 2 - 12 * x + 11
+    x0 = np.array([0.5, 3.5, 1.8])
+    roots, status = newton_raphson_batch(f, df, x0)
+    expected = [newton_raphson(f, df, x) for x in x0]
+    assert np.allclose(roots, expected, atol=1e-8)
+    assert np.all(status == CONVERGED)
+
+
+def test_newton_raphson_batch_per_lane_args():
+    targets = np.linspace(1.0, 100.0, 1000)
+    f = lambda x, t: x ** 2 - t
+    df = lambda x, t: 2 * x
+    roots, status = newton_raphson_batch(f, df, np.ones_like(targets), args=(targets,))
+    assert np.allclose(roots, np.sqrt(targets), atol=1e-8)
+    assert np.all(status == CONVERGED)
+
+
+def test_newton_raphson_batch_active_lanes_only():
+    sizes = []
+
+    def f(x):
+        sizes.append(x.size)
+        return x - 1
+
+    df = lambda x: np.ones_like(x)
+    x0 = np.array([1.0, 5.0])
+    roots, _ = newton_raphson_batch(f, df, x0)
+    assert np.allclose(roots, 1.0)
+    assert sizes == [2, 1]
+
+
+def test_newton_raphson_batch_failed_lanes():
+    f = lambda x: x ** 3 - 2 * x + 2
+    df = lambda x: 3 * x ** 2 - 2
+    x0 = np.array([-2.0, 0.0, np.sqrt(2 / 3)])
+    roots, status = newton_raphson_batch(f, df, x0, max_iterations=50)
+    assert status[0] == CONVERGED
+    assert np.isclose(f(roots[0]), 0.0, atol=1e-8)
+    assert status[1] == NOT_CONVERGED
+    assert status[2] == ZERO_DERIVATIVE
+    assert np.all(np.isnan(roots[1:]))
+
+
+def test_newton_raphson_batch_shape():
+    f = lambda x: np.sin(x)
+    df = lambda x: np.cos(x)
+    x0 = np.full((2, 3), 3.0)
+    roots, status = newton_raphson_batch(f, df, x0)
+    assert roots.shape == status.shape == (2, 3)
+    assert np.allclose(roots, np.pi)
+
+
 # Multivariate Tests
 
 
@@ -207,3 +273,125 @@ def test_newton_raphson_system_large_system():
         np.array([6, 4, 2, 1]),
     )
     assert np.allclose(root, expected, atol=1e-8)
+
+
+def _tridiagonal_system(n):
+    A = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    b = np.linspace(1.0, 2.0, n)
+
+    def F(x):
+        return A @ x + 0.1 * x ** 3 - b
+
+    def J(x):
+        return A + np.diag(0.3 * x ** 2)
+
+    return F, J
+
+
+@pytest.mark.parametrize("strategy", ["newton", "chord", "broyden"])
+def test_newton_raphson_system_strategies(strategy):
+    F, J = _tridiagonal_system(50)
+    x0 = np.zeros(50)
+    root, info = newton_raphson_system(
+        F, J, x0, tol=1e-12, strategy=strategy, return_info=True
+    )
+    assert np.allclose(F(root), 0.0, atol=1e-10)
+    assert info["factorizations"] == info["jacobian_evaluations"]
+    assert info["function_evaluations"] == info["iterations"]
+
+
+def test_newton_raphson_system_jacobian_reuse():
+    F, J = _tridiagonal_system(50)
+    x0 = np.zeros(50)
+    _, newton_info = newton_raphson_system(F, J, x0, tol=1e-12, return_info=True)
+    for strategy in ("chord", "broyden"):
+        _, info = newton_raphson_system(
+            F, J, x0, tol=1e-12, strategy=strategy, return_info=True
+        )
+        assert info["jacobian_evaluations"] < newton_info["jacobian_evaluations"]
+
+
+def test_newton_raphson_system_stall_refresh():
+    def F(x):
+        return np.array([np.exp(x[0]) - 1, x[1] ** 3 + x[1] - 2])
+
+    def J(x):
+        return np.array([[np.exp(x[0]), 0], [0, 3 * x[1] ** 2 + 1]])
+
+    x0 = np.array([2.0, 3.0])
+    root, info = newton_raphson_system(
+        F, J, x0, strategy="chord", jacobian_refresh=1000, return_info=True
+    )
+    assert np.allclose(root, [0.0, 1.0], atol=1e-8)
+    assert info["jacobian_evaluations"] > 1
+
+
+def test_newton_raphson_system_unknown_strategy():
+    F, J = _tridiagonal_system(3)
+    with pytest.raises(ValueError):
+        newton_raphson_system(F, J, np.zeros(3), strategy="halley")
+
+
+def _sparse_system(n):
+    A = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr")
+    b = np.linspace(1.0, 2.0, n)
+
+    def F(x):
+        return A @ x + 0.1 * x ** 3 - b
+
+    def J(x):
+        return A + sp.diags(0.3 * x ** 2)
+
+    return F, J
+
+
+def test_newton_raphson_system_sparse_jacobian():
+    F, J = _sparse_system(20000)
+    root, info = newton_raphson_system(F, J, np.zeros(20000), return_info=True)
+    assert np.allclose(F(root), 0.0, atol=1e-8)
+    assert info["factorizations"] == info["jacobian_evaluations"]
+
+
+def test_newton_raphson_system_sparse_matches_dense():
+    F, J = _sparse_system(30)
+    dense_root = newton_raphson_system(F, lambda x: J(x).toarray(), np.zeros(30))
+    sparse_root = newton_raphson_system(F, J, np.zeros(30))
+    assert np.allclose(dense_root, sparse_root, atol=1e-10)
+
+
+def test_newton_raphson_system_gmres():
+    F, J = _sparse_system(20000)
+    root, info = newton_raphson_system(
+        F, J, np.zeros(20000), linear_solver="gmres", return_info=True
+    )
+    assert np.allclose(F(root), 0.0, atol=1e-6)
+    assert info["factorizations"] == 0
+
+
+def test_newton_raphson_system_gmres_matrix_free():
+    n = 1000
+    F, J = _sparse_system(n)
+
+    def J_operator(x):
+        Jx = J(x)
+        return LinearOperator((n, n), matvec=lambda v: Jx @ v, dtype=float)
+
+    root = newton_raphson_system(F, J_operator, np.zeros(n), linear_solver="gmres")
+    assert np.allclose(F(root), 0.0, atol=1e-6)
+
+
+def test_newton_raphson_system_sparse_singular_jacobian():
+    def F(x):
+        return np.array([x[0] ** 2, x[0] * x[1]])
+
+    def J(x):
+        return sp.csr_matrix(np.array([[2 * x[0], 0], [x[1], x[0]]]))
+
+    with pytest.raises(ValueError):
+        newton_raphson_system(F, J, np.array([0.0, 0.0]))
+
+
+def test_newton_raphson_system_unknown_linear_solver():
+    F, J = _tridiagonal_system(3)
+    with pytest.raises(ValueError):
+        newton_raphson_system(F, J, np.zeros(3), linear_solver="qr")
@@ -0,0 +1,82 @@
+# polynomial_roots.py
+import numpy as np
+from typing import Tuple
+
+
+def _horner(coefficients: np.ndarray, z: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate p(z) and p'(z) row by row for polynomials stored one per row."""
+    p = np.broadcast_to(coefficients[:, :1], z.shape).astype(complex)
+    dp = np.zeros_like(p)
+    for k in range(1, coefficients.shape[1]):
+        dp = dp * z + p
+        p = p * z + coefficients[:, k : k + 1]
+    return p, dp
+
+
+def aberth_ehrlich(
+    coefficients: np.ndarray,
+    tol: float = 1e-12,
+    max_iterations: int = 500,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find all roots of a batch of polynomials with the Aberth-Ehrlich iteration.
+
+    All roots of all polynomials are refined simultaneously with NumPy
+    operations over the batch; each iteration is one Newton correction per
+    root, deflated implicitly by the repulsion from the other roots.
+
+    Args:
+        coefficients (np.ndarray): Array of shape (k, n + 1) holding k polynomials
+            of degree n, highest power first (the convention of np.roots).
+            A 1-D array is treated as a single polynomial.
+        tol (float, optional): Relative tolerance on the correction of each root.
+            Defaults to 1e-12.
+        max_iterations (int, optional): Maximum number of iterations. Defaults to 500.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Complex roots of shape (k, n) and a boolean
+        array of shape (k,) telling which polynomials converged.
+
+    Raises:
+        ValueError: If a polynomial has degree below 1 or a zero leading coefficient.
+    """
+    coefficients = np.asarray(coefficients)
+    single = coefficients.ndim == 1
+    coefficients = np.atleast_2d(coefficients).astype(complex)
+    k, n = coefficients.shape[0], coefficients.shape[1] - 1
+    if n < 1:
+        raise ValueError("Polynomials must have degree at least 1.")
+    if np.any(coefficients[:, 0] == 0):
+        raise ValueError("Leading coefficients must be nonzero.")
+    coefficients = coefficients / coefficients[:, :1]
+
+    # Start on a circle enclosing all roots (Cauchy bound), with an offset angle
+    # so that the starting points are not symmetric about the real axis.
+    radius = 1 + np.max(np.abs(coefficients[:, 1:]), axis=1, keepdims=True)
+    angles = 2 * np.pi * np.arange(n) / n + 0.4
+    z = radius * np.exp(1j * angles)
+
+    active = np.ones((k, n), dtype=bool)
+    for _ in range(max_iterations):
+        rows = np.flatnonzero(active.any(axis=1))
+        if rows.size == 0:
+            break
+        zr = z[rows]
+        p, dp = _horner(coefficients[rows], zr)
+        ratio = np.divide(p, dp, out=np.zeros_like(p), where=dp != 0)
+        difference = zr[:, :, None] - zr[:, None, :]
+        np.einsum("kii->ki", difference)[...] = np.inf
+        repulsion = np.sum(1 / difference, axis=2)
+        denominator = 1 - ratio * repulsion
+        step = np.divide(ratio, denominator, out=ratio.copy(), where=denominator != 0)
+        # p'(z) = 0 with p(z) != 0: nudge the root instead of dividing by zero
+        step = np.where((dp == 0) & (p != 0), tol * (1 + np.abs(zr)) + 1e-3j, step)
+
+        moving = active[rows]
+        z[rows] = np.where(moving, zr - step, zr)
+        active[rows] = moving & ~(np.abs(step) <= tol * (1 + np.abs(zr)))
+
+    converged = ~active.any(axis=1)
+    if single:
+        return z[0], converged[0]
+    return z, converged
@@ -0,0 +1,75 @@
+# test_polynomial_roots.py
+import pytest
+import numpy as np
+from ..implementation.polynomial_roots import aberth_ehrlich
+
+
+def assert_same_roots(roots, expected, atol):
+    roots = list(roots)
+    for r in expected:
+        distances = np.abs(np.array(roots) - r)
+        i = int(np.argmin(distances))
+        assert distances[i] < atol
+        roots.pop(i)
+
+
+def test_aberth_quadratic():
+    roots, converged = aberth_ehrlich([1, -3, 2])
+    assert converged
+    assert_same_roots(roots, [1.0, 2.0], atol=1e-10)
+
+
+def test_aberth_complex_roots():
+    roots, converged = aberth_ehrlich([1, 0, 1])
+    assert converged
+    assert_same_roots(roots, [1j, -1j], atol=1e-10)
+
+
+def test_aberth_matches_np_roots_batch():
+    rng = np.random.default_rng(0)
+    coefficients = rng.normal(size=(2000, 7))
+    roots, converged = aberth_ehrlich(coefficients)
+    assert roots.shape == (2000, 6)
+    assert np.all(converged)
+    for row in range(0, 2000, 97):
+        assert_same_roots(roots[row], np.roots(coefficients[row]), atol=1e-8)
+
+
+def test_aberth_characteristic_polynomials():
+    rng = np.random.default_rng(1)
+    matrices = rng.normal(size=(50, 4, 4))
+    matrices = matrices + matrices.transpose(0, 2, 1)
+    coefficients = np.array([np.poly(m) for m in matrices])
+    roots, converged = aberth_ehrlich(coefficients)
+    assert np.all(converged)
+    assert np.allclose(roots.imag, 0.0, atol=1e-8)
+    expected = np.linalg.eigvalsh(matrices)
+    assert np.allclose(np.sort(roots.real, axis=1), expected, atol=1e-8)
+
+
+def test_aberth_multiple_root():
+    roots, converged = aberth_ehrlich(np.poly([1.0, 1.0, 3.0]).real)
+    assert converged
+    assert_same_roots(roots, [1.0, 1.0, 3.0], atol=1e-6)
+
+
+def test_aberth_zero_root():
+    roots, _ = aberth_ehrlich([1, -1, 0])
+    assert_same_roots(roots, [0.0, 1.0], atol=1e-10)
+
+
+def test_aberth_not_converged_flag():
+    coefficients = np.array([[1, -3, 2], [1, 0, -5]])
+    _, converged = aberth_ehrlich(coefficients, max_iterations=1)
+    assert converged.shape == (2,)
+    assert not np.any(converged)
+
+
+def test_aberth_invalid_leading_coefficient():
+    with pytest.raises(ValueError):
+        aberth_ehrlich([[0, 1, 2]])
+
+
+def test_aberth_constant_polynomial():
+    with pytest.raises(ValueError):
+        aberth_ehrlich([[3.0]])
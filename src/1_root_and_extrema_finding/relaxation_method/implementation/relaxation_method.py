@@ -1,6 +1,6 @@
 # relaxation_method.py
 import numpy as np
-from typing import Callable
+from typing import Callable, Optional
 
 
 def relaxation_method(
@@ -9,19 +9,74 @@ def relaxation_method(
     omega: float = None,
     tol: float = 1e-6,
     max_iterations: int = 100000,
+    derivative: Optional[Callable[[float], float]] = None,
+    accelerate: bool = False,
 ) -> float:
     x = initial_guess
     delta = 1e-8
     for _ in range(max_iterations):
-        f_prime = (func(x + delta) - func(x - delta)) / (2 * delta)
-        if abs(f_prime) >= 1:
-            if f_prime == 0:
-                return np.nan
-            omega = -1.0 / f_prime
+        if accelerate:
+            # Steffensen's method: Aitken's delta-squared extrapolation of two
+            # plain fixed-point steps, converging quadratically.
+            x1 = func(x)
+            x2 = func(x1)
+            denominator = x2 - 2 * x1 + x
+            x_new = x - (x1 - x) ** 2 / denominator if denominator != 0 else x2
         else:
-            omega = 1.0
-        x_new = (1 - omega) * x + omega * func(x)
+            if derivative is not None:
+                f_prime = derivative(x)
+            else:
+                f_prime = (func(x + delta) - func(x - delta)) / (2 * delta)
+            if abs(f_prime) >= 1:
+                if f_prime == 0:
+                    return np.nan
+                omega = -1.0 / f_prime
+            else:
+                omega = 1.0
+            x_new = (1 - omega) * x + omega * func(x)
         if np.abs(x_new - x) < tol:
             return x_new
         x = x_new
     return x
+
+
+def relaxation_method_batch(
+    func: Callable[[np.ndarray], np.ndarray],
+    initial_guess: np.ndarray,
+    tol: float = 1e-6,
+    max_iterations: int = 100000,
+    derivative: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    accelerate: bool = False,
+) -> np.ndarray:
+    """
+    Iterate many independent fixed points x = func(x) at once.
+
+    Applies the same update as `relaxation_method` elementwise, calling the
+    vectorized func on the whole array. Lanes that have converged are frozen.
+    """
+    x = np.array(initial_guess, dtype=float)
+    active = np.ones(x.shape, dtype=bool)
+    delta = 1e-8
+    for _ in range(max_iterations):
+        if not np.any(active):
+            break
+        if accelerate:
+            x1 = func(x)
+            x2 = func(x1)
+            denominator = x2 - 2 * x1 + x
+            extrapolated = np.divide(
+                (x1 - x) ** 2, denominator, out=np.zeros_like(x), where=denominator != 0
+            )
+            x_new = np.where(denominator != 0, x - extrapolated, x2)
+        else:
+            if derivative is not None:
+                f_prime = np.asarray(derivative(x), dtype=float)
+            else:
+                f_prime = (func(x + delta) - func(x - delta)) / (2 * delta)
+            steep = np.abs(f_prime) >= 1
+            omega = np.divide(-1.0, f_prime, out=np.ones_like(x), where=steep)
+            x_new = (1 - omega) * x + omega * func(x)
+        converged = np.abs(x_new - x) < tol
+        x = np.where(active, x_new, x)
+        active &= ~converged
+    return x
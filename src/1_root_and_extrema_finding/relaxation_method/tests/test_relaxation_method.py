@@ -1,7 +1,10 @@
 # test_relaxation_method.py
 import pytest
 import numpy as np
-from ..implementation.relaxation_method import relaxation_method
+from ..implementation.relaxation_method import (
+    relaxation_method,
+    relaxation_method_batch,
+)
 
 
 def test_relaxation_constant():
@@ -114,3 +117,66 @@ def test_relaxation_omega_adjustment():
     # Fixed point: x = 0.5x + 1 => x = 2
     expected = 2.0
     assert np.isclose(root, expected, atol=1e-6)
+
+
+def counted(f):
+    def wrapper(x):
+        wrapper.calls += 1
+        return f(x)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+def test_relaxation_analytic_derivative():
+    f = counted(lambda x: x - 0.1 * (x ** 3 - x - 2))
+    df = lambda x: 1 - 0.1 * (3 * x ** 2 - 1)
+    root = relaxation_method(f, 1.5, tol=1e-10, derivative=df)
+    assert np.isclose(root, 1.5213797068045676, atol=1e-8)
+    iterations = f.calls
+    f.calls = 0
+    relaxation_method(f, 1.5, tol=1e-10)
+    assert f.calls == 3 * iterations
+
+
+@pytest.mark.parametrize(
+    "f, expected",
+    [
+        (lambda x: np.cos(x), 0.7390851332151607),
+        (lambda x: np.sqrt(4 + x), 2.5615528128088303),
+        (lambda x: x / 2 + 1, 2.0),
+        (lambda x: 5.0, 5.0),
+    ],
+)
+def test_relaxation_accelerated(f, expected):
+    root = relaxation_method(f, 0.0, tol=1e-12, accelerate=True)
+    assert np.isclose(root, expected, atol=1e-10)
+
+
+def test_relaxation_accelerated_fewer_calls():
+    f = counted(lambda x: np.exp(-x))
+    plain = relaxation_method(f, 0.0, tol=1e-12)
+    plain_calls = f.calls
+    f.calls = 0
+    accelerated = relaxation_method(f, 0.0, tol=1e-12, accelerate=True)
+    assert np.isclose(plain, accelerated, atol=1e-10)
+    assert 10 * f.calls < plain_calls
+
+
+def test_relaxation_batch_matches_scalar():
+    c = np.linspace(0.5, 3.0, 50)
+    f = lambda x: np.sqrt(c + x)
+    roots = relaxation_method_batch(f, np.zeros_like(c), tol=1e-12)
+    expected = (1 + np.sqrt(1 + 4 * c)) / 2
+    assert np.allclose(roots, expected, atol=1e-10)
+
+
+@pytest.mark.parametrize("accelerate", [False, True])
+def test_relaxation_batch_modes(accelerate):
+    c = np.linspace(0.1, 1.0, 1000)
+    f = lambda x: c * np.cos(x)
+    df = lambda x: -c * np.sin(x)
+    roots = relaxation_method_batch(
+        f, np.zeros_like(c), tol=1e-12, derivative=df, accelerate=accelerate
+    )
+    assert np.allclose(roots, c * np.cos(roots), atol=1e-10)
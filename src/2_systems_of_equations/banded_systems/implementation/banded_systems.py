@@ -0,0 +1,165 @@
+# banded_systems.py
+import numpy as np
+from typing import Tuple
+
+TridiagonalFactors = Tuple[np.ndarray, np.ndarray, np.ndarray]
+CyclicFactors = Tuple[TridiagonalFactors, np.ndarray, np.ndarray, float]
+BandedFactors = Tuple[int, int, np.ndarray]
+
+
+def tridiagonal_factor(
+    lower: np.ndarray, diag: np.ndarray, upper: np.ndarray
+) -> TridiagonalFactors:
+    """
+    LU factorization of a tridiagonal matrix without pivoting (Thomas algorithm).
+
+    lower[i] = A[i + 1, i], diag[i] = A[i, i] and upper[i] = A[i, i + 1]. The
+    factorization costs O(n) and is stable for diagonally dominant or symmetric
+    positive definite matrices. Returns (multipliers, pivots, upper) for use
+    with tridiagonal_solve.
+    """
+    diag = np.asarray(diag, dtype=float)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.array(upper, dtype=float)
+    n: int = diag.shape[0]
+    if lower.shape != (n - 1,) or upper.shape != (n - 1,):
+        raise ValueError("Off-diagonals must have one element fewer than diag.")
+    multipliers = np.empty(n - 1)
+    pivots = np.empty(n)
+    pivots[0] = diag[0]
+    for i in range(n - 1):
+        if pivots[i] == 0:
+            raise ValueError("Zero pivot encountered; the matrix needs pivoting.")
+        multipliers[i] = lower[i] / pivots[i]
+        pivots[i + 1] = diag[i + 1] - multipliers[i] * upper[i]
+    if pivots[-1] == 0:
+        raise ValueError("Zero pivot encountered; the matrix needs pivoting.")
+    return multipliers, pivots, upper
+
+
+def tridiagonal_solve(factors: TridiagonalFactors, b: np.ndarray) -> np.ndarray:
+    """
+    Solve A x = b from tridiagonal_factor output in O(n) per right-hand side.
+
+    b may be a vector of length n or an (n, k) array whose k columns are
+    solved together.
+    """
+    multipliers, pivots, upper = factors
+    n: int = pivots.shape[0]
+    x = np.array(b, dtype=float)
+    if x.shape[0] != n:
+        raise ValueError("Right-hand side must have as many rows as the matrix.")
+    for i in range(1, n):
+        x[i] -= multipliers[i - 1] * x[i - 1]
+    x[-1] /= pivots[-1]
+    for i in range(n - 2, -1, -1):
+        x[i] = (x[i] - upper[i] * x[i + 1]) / pivots[i]
+    return x
+
+
+def solve_tridiagonal(
+    lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    return tridiagonal_solve(tridiagonal_factor(lower, diag, upper), b)
+
+
+def cyclic_tridiagonal_factor(
+    lower: np.ndarray, diag: np.ndarray, upper: np.ndarray
+) -> CyclicFactors:
+    """
+    Factor a periodic (cyclic) tridiagonal matrix.
+
+    All three arrays have length n: lower[i] = A[i, i - 1] and
+    upper[i] = A[i, (i + 1) % n], so lower[0] and upper[-1] are the corner
+    entries A[0, n - 1] and A[n - 1, 0]. The corners are removed by a rank-one
+    Sherman-Morrison correction, leaving a plain tridiagonal factorization.
+    """
+    diag = np.array(diag, dtype=float)
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    n: int = diag.shape[0]
+    if n < 3:
+        raise ValueError("Cyclic systems need at least three unknowns.")
+    if lower.shape != (n,) or upper.shape != (n,):
+        raise ValueError("lower, diag and upper must have equal lengths.")
+    top_right, bottom_left = lower[0], upper[-1]
+    gamma: float = -diag[0] if diag[0] != 0 else -1.0
+    # A = T + u v^T with u = (gamma, 0, ..., bottom_left) and
+    # v = (1, 0, ..., top_right / gamma)
+    diag[0] -= gamma
+    diag[-1] -= bottom_left * top_right / gamma
+    factors = tridiagonal_factor(lower[1:], diag, upper[:-1])
+    u = np.zeros(n)
+    u[0], u[-1] = gamma, bottom_left
+    v = np.zeros(n)
+    v[0], v[-1] = 1.0, top_right / gamma
+    z = tridiagonal_solve(factors, u)
+    denominator: float = 1.0 + v @ z
+    if denominator == 0:
+        raise ValueError("Matrix is singular.")
+    return factors, z, v, denominator
+
+
+def cyclic_tridiagonal_solve(factors: CyclicFactors, b: np.ndarray) -> np.ndarray:
+    tridiagonal, z, v, denominator = factors
+    y = tridiagonal_solve(tridiagonal, b)
+    return y - np.multiply.outer(z, (v @ y) / denominator)
+
+
+def solve_cyclic_tridiagonal(
+    lower: np.ndarray, diag: np.ndarray, upper: np.ndarray, b: np.ndarray
+) -> np.ndarray:
+    return cyclic_tridiagonal_solve(cyclic_tridiagonal_factor(lower, diag, upper), b)
+
+
+def banded_factor(l_and_u: Tuple[int, int], ab: np.ndarray) -> BandedFactors:
+    """
+    LU factorization of a banded matrix without pivoting.
+
+    ab uses the LAPACK band storage of scipy.linalg.solve_banded: with l
+    sub-diagonals and u super-diagonals, A[i, j] = ab[u + i - j, j]. Without
+    pivoting there is no fill-in, so L and U overwrite a copy of ab and the
+    cost is O(n l u).
+    """
+    l, u = l_and_u
+    LU = np.array(ab, dtype=float)
+    if LU.ndim != 2 or LU.shape[0] != l + u + 1:
+        raise ValueError("ab must have l + u + 1 rows.")
+    n: int = LU.shape[1]
+    for k in range(n):
+        pivot: float = LU[u, k]
+        if pivot == 0:
+            raise ValueError("Zero pivot encountered; the matrix needs pivoting.")
+        rows = np.arange(1, min(l, n - 1 - k) + 1)
+        cols = np.arange(1, min(u, n - 1 - k) + 1)
+        if rows.size == 0:
+            continue
+        multipliers = LU[u + rows, k] / pivot
+        LU[u + rows, k] = multipliers
+        if cols.size:
+            # A[k + r, k + c] -= m_r * A[k, k + c]
+            LU[u + rows[:, None] - cols, k + cols] -= np.outer(
+                multipliers, LU[u - cols, k + cols]
+            )
+    return l, u, LU
+
+
+def banded_solve(factors: BandedFactors, b: np.ndarray) -> np.ndarray:
+    """Solve A x = b from banded_factor output; b may have shape (n,) or (n, k)."""
+    l, u, LU = factors
+    n: int = LU.shape[1]
+    x = np.array(b, dtype=float)
+    if x.shape[0] != n:
+        raise ValueError("Right-hand side must have as many rows as the matrix.")
+    for k in range(n - 1):
+        rows = np.arange(1, min(l, n - 1 - k) + 1)
+        x[k + 1 : k + 1 + rows.size] -= np.multiply.outer(LU[u + rows, k], x[k])
+    for k in range(n - 1, -1, -1):
+        cols = np.arange(1, min(u, n - 1 - k) + 1)
+        x[k] -= LU[u - cols, k + cols] @ x[k + 1 : k + 1 + cols.size]
+        x[k] /= LU[u, k]
+    return x
+
+
+def solve_banded(l_and_u: Tuple[int, int], ab: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return banded_solve(banded_factor(l_and_u, ab), b)
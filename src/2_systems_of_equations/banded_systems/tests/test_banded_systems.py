@@ -0,0 +1,138 @@
+# test_banded_systems.py
+import pytest
+import numpy as np
+from scipy.linalg import solve_banded as scipy_solve_banded
+from ..implementation.banded_systems import (
+    tridiagonal_factor,
+    tridiagonal_solve,
+    solve_tridiagonal,
+    cyclic_tridiagonal_factor,
+    cyclic_tridiagonal_solve,
+    solve_cyclic_tridiagonal,
+    banded_factor,
+    banded_solve,
+    solve_banded,
+)
+
+
+def random_tridiagonal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lower = rng.uniform(-1, 1, n - 1)
+    upper = rng.uniform(-1, 1, n - 1)
+    diag = 3.0 + rng.uniform(0, 1, n)
+    A = np.diag(diag) + np.diag(lower, -1) + np.diag(upper, 1)
+    return lower, diag, upper, A
+
+
+def test_solve_tridiagonal_matches_dense():
+    lower, diag, upper, A = random_tridiagonal(50)
+    b = np.arange(50, dtype=float)
+    x = solve_tridiagonal(lower, diag, upper, b)
+    assert np.allclose(x, np.linalg.solve(A, b))
+
+
+def test_tridiagonal_multiple_right_hand_sides():
+    lower, diag, upper, A = random_tridiagonal(30, seed=1)
+    B = np.random.default_rng(2).standard_normal((30, 7))
+    X = tridiagonal_solve(tridiagonal_factor(lower, diag, upper), B)
+    assert X.shape == (30, 7)
+    assert np.allclose(A @ X, B)
+
+
+def test_tridiagonal_factors_reused_and_input_untouched():
+    lower, diag, upper, A = random_tridiagonal(20, seed=3)
+    factors = tridiagonal_factor(lower, diag, upper)
+    for seed in range(3):
+        b = np.random.default_rng(seed).standard_normal(20)
+        b_copy = b.copy()
+        x = tridiagonal_solve(factors, b)
+        assert np.allclose(A @ x, b)
+        assert np.array_equal(b, b_copy)
+
+
+def test_tridiagonal_single_unknown():
+    assert np.allclose(solve_tridiagonal([], [4.0], [], [2.0]), [0.5])
+
+
+def test_tridiagonal_zero_pivot():
+    with pytest.raises(ValueError):
+        solve_tridiagonal([1.0], [0.0, 1.0], [1.0], [1.0, 1.0])
+
+
+def test_tridiagonal_bad_shapes():
+    with pytest.raises(ValueError):
+        tridiagonal_factor([1.0, 1.0], [2.0, 2.0], [1.0])
+    factors = tridiagonal_factor([1.0], [2.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        tridiagonal_solve(factors, np.ones(3))
+
+
+def test_cyclic_tridiagonal_matches_dense():
+    n = 12
+    rng = np.random.default_rng(4)
+    lower = rng.uniform(-1, 1, n)
+    upper = rng.uniform(-1, 1, n)
+    diag = 3.0 + rng.uniform(0, 1, n)
+    A = np.diag(diag) + np.diag(lower[1:], -1) + np.diag(upper[:-1], 1)
+    A[0, -1] = lower[0]
+    A[-1, 0] = upper[-1]
+    B = rng.standard_normal((n, 3))
+    assert np.allclose(
+        solve_cyclic_tridiagonal(lower, diag, upper, B), np.linalg.solve(A, B)
+    )
+    factors = cyclic_tridiagonal_factor(lower, diag, upper)
+    x = cyclic_tridiagonal_solve(factors, B[:, 0])
+    assert x.shape == (n,)
+    assert np.allclose(A @ x, B[:, 0])
+
+
+def test_cyclic_periodic_laplacian():
+    # Periodic 1D Helmholtz operator (2 + s) u_i - u_{i-1} - u_{i+1}
+    n = 16
+    ones = np.ones(n)
+    x_true = np.sin(2 * np.pi * np.arange(n) / n)
+    A = 2.5 * np.eye(n) - np.roll(np.eye(n), 1, axis=1) - np.roll(np.eye(n), -1, axis=1)
+    x = solve_cyclic_tridiagonal(-ones, 2.5 * ones, -ones, A @ x_true)
+    assert np.allclose(x, x_true)
+
+
+def test_cyclic_too_small():
+    with pytest.raises(ValueError):
+        cyclic_tridiagonal_factor(np.ones(2), np.ones(2), np.ones(2))
+
+
+def to_band(A, l, u):
+    n = A.shape[0]
+    ab = np.zeros((l + u + 1, n))
+    for i in range(n):
+        for j in range(max(0, i - l), min(n, i + u + 1)):
+            ab[u + i - j, j] = A[i, j]
+    return ab
+
+
+@pytest.mark.parametrize("l, u", [(1, 1), (2, 2), (1, 3), (0, 2), (2, 0)])
+def test_solve_banded_matches_scipy(l, u):
+    n = 25
+    rng = np.random.default_rng(l * 10 + u)
+    A = np.triu(np.tril(rng.uniform(-1, 1, (n, n)), u), -l) + (l + u + 2) * np.eye(n)
+    ab = to_band(A, l, u)
+    B = rng.standard_normal((n, 4))
+    X = solve_banded((l, u), ab, B)
+    assert np.allclose(X, scipy_solve_banded((l, u), ab, B))
+    assert np.allclose(banded_solve(banded_factor((l, u), ab), B[:, 1]), X[:, 1])
+
+
+def test_banded_factor_does_not_modify_input():
+    A = 4 * np.eye(6) - np.eye(6, k=1) - np.eye(6, k=-1)
+    ab = to_band(A, 1, 1)
+    ab_copy = ab.copy()
+    banded_factor((1, 1), ab)
+    assert np.array_equal(ab, ab_copy)
+
+
+def test_banded_zero_pivot_and_bad_storage():
+    ab = np.array([[0.0, 1.0, 1.0], [0.0, 1.0, 1.0], [1.0, 1.0, 0.0]])
+    with pytest.raises(ValueError):
+        banded_factor((1, 1), ab)
+    with pytest.raises(ValueError):
+        banded_factor((2, 1), ab)
@@ -0,0 +1,80 @@
+# cholesky_decomposition.py
+import numpy as np
+from scipy.linalg import solve_triangular
+
+
+def cholesky_decomposition(
+    A: np.ndarray, block_size: int = 64, overwrite_a: bool = False
+) -> np.ndarray:
+    """
+    Right-looking blocked Cholesky factorization A = L @ L.T of an SPD matrix.
+
+    Only the lower triangle of A is read. Each diagonal block is factored
+    column by column, the panel below it is found with one triangular solve,
+    and the trailing submatrix is updated with one matrix-matrix product. L
+    overwrites A when overwrite_a is True and A is already a float array.
+    """
+    n: int = A.shape[0]
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1.")
+    if overwrite_a and A.dtype == float:
+        L: np.ndarray = A
+    else:
+        L = A.astype(float)
+    for k in range(0, n, block_size):
+        end: int = min(k + block_size, n)
+        for j in range(k, end):
+            diagonal: float = L[j, j] - L[j, k:j] @ L[j, k:j]
+            if diagonal <= 0:
+                raise ValueError("Matrix is not positive definite.")
+            L[j, j] = np.sqrt(diagonal)
+            L[j + 1 : end, j] = (
+                L[j + 1 : end, j] - L[j + 1 : end, k:j] @ L[j, k:j]
+            ) / L[j, j]
+        if end < n:
+            # L21 = A21 L11^-T, then A22 -= L21 @ L21.T
+            L[end:, k:end] = solve_triangular(
+                L[k:end, k:end], L[end:, k:end].T, lower=True
+            ).T
+            L[end:, end:] -= L[end:, k:end] @ L[end:, k:end].T
+    L[np.triu_indices(n, 1)] = 0.0
+    return L
+
+
+def cholesky_solve(L: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Solve L L^T x = b; b may be a vector or an (n, m) block of right-hand sides."""
+    y: np.ndarray = solve_triangular(L, np.asarray(b, dtype=float), lower=True)
+    return solve_triangular(L, y, lower=True, trans="T")
+
+
+def cholesky_update(
+    L: np.ndarray, x: np.ndarray, downdate: bool = False, overwrite_l: bool = False
+) -> np.ndarray:
+    """
+    Rank-one update of a Cholesky factor in O(n^2).
+
+    Returns the factor of L L^T + x x^T, or of L L^T - x x^T when downdate is
+    True, by sweeping x into L one column at a time with plane rotations
+    (hyperbolic rotations for a downdate). A downdate that would leave the
+    matrix indefinite raises ValueError.
+    """
+    n: int = L.shape[0]
+    if x.shape != (n,):
+        raise ValueError("Vector x must have one entry per row of L.")
+    if not (overwrite_l and L.dtype == float):
+        L = L.astype(float)
+    x = x.astype(float)
+    sign: float = -1.0 if downdate else 1.0
+    for k in range(n):
+        r_squared: float = L[k, k] ** 2 + sign * x[k] ** 2
+        if r_squared <= 0:
+            raise ValueError("Downdated matrix is not positive definite.")
+        r: float = np.sqrt(r_squared)
+        c: float = r / L[k, k]
+        s: float = x[k] / L[k, k]
+        L[k, k] = r
+        L[k + 1 :, k] = (L[k + 1 :, k] + sign * s * x[k + 1 :]) / c
+        x[k + 1 :] = c * x[k + 1 :] - s * L[k + 1 :, k]
+    return L
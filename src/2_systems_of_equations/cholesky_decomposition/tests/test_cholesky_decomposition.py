@@ -0,0 +1,109 @@
+# test_cholesky_decomposition.py
+import pytest
+import numpy as np
+from ..implementation.cholesky_decomposition import (
+    cholesky_decomposition,
+    cholesky_solve,
+    cholesky_update,
+)
+
+
+def random_spd(n, seed=0):
+    rng = np.random.default_rng(seed)
+    M = rng.standard_normal((n, n))
+    return M @ M.T + n * np.eye(n)
+
+
+@pytest.mark.parametrize("block_size", [1, 3, 16, 64])
+def test_cholesky_matches_numpy(block_size):
+    A = random_spd(40)
+    L = cholesky_decomposition(A, block_size=block_size)
+    assert np.allclose(L, np.linalg.cholesky(A))
+    assert np.allclose(L, np.tril(L))
+
+
+def test_cholesky_overwrite_a():
+    A = random_spd(10, seed=1)
+    expected = np.linalg.cholesky(A)
+    L = cholesky_decomposition(A, block_size=4, overwrite_a=True)
+    assert L is A
+    assert np.allclose(A, expected)
+
+
+def test_cholesky_leaves_input_untouched_by_default():
+    A = random_spd(8, seed=2)
+    A_copy = A.copy()
+    cholesky_decomposition(A, block_size=3)
+    assert np.array_equal(A, A_copy)
+
+
+def test_cholesky_reads_lower_triangle_only():
+    A = random_spd(6, seed=3)
+    L = cholesky_decomposition(np.tril(A))
+    assert np.allclose(L @ L.T, A)
+
+
+def test_cholesky_not_positive_definite():
+    A = np.array([[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError):
+        cholesky_decomposition(A)
+
+
+def test_cholesky_non_square():
+    with pytest.raises(ValueError):
+        cholesky_decomposition(np.ones((2, 3)))
+
+
+def test_cholesky_solve_multiple_right_hand_sides():
+    A = random_spd(25, seed=4)
+    B = np.random.default_rng(5).standard_normal((25, 6))
+    L = cholesky_decomposition(A, block_size=8)
+    X = cholesky_solve(L, B)
+    assert np.allclose(A @ X, B)
+    assert np.allclose(cholesky_solve(L, B[:, 2]), X[:, 2])
+
+
+def test_cholesky_update_and_downdate():
+    A = random_spd(12, seed=6)
+    x = np.random.default_rng(7).standard_normal(12)
+    L = cholesky_decomposition(A)
+    L_up = cholesky_update(L, x)
+    assert np.allclose(L_up, np.linalg.cholesky(A + np.outer(x, x)))
+    L_down = cholesky_update(L_up, x, downdate=True)
+    assert np.allclose(L_down, L)
+
+
+def test_cholesky_update_overwrite_l():
+    A = random_spd(5, seed=8)
+    L = cholesky_decomposition(A)
+    x = np.ones(5)
+    L_new = cholesky_update(L, x, overwrite_l=True)
+    assert L_new is L
+    assert np.allclose(L @ L.T, A + np.outer(x, x))
+
+
+def test_cholesky_downdate_indefinite():
+    L = np.eye(3)
+    with pytest.raises(ValueError):
+        cholesky_update(L, np.array([2.0, 0.0, 0.0]), downdate=True)
+
+
+def test_cholesky_update_bad_shape():
+    with pytest.raises(ValueError):
+        cholesky_update(np.eye(3), np.ones(2))
+
+
+def test_rolling_window_regression():
+    rng = np.random.default_rng(9)
+    X = np.column_stack([np.ones(60), rng.standard_normal((60, 3))])
+    y = X @ np.array([1.0, -2.0, 0.5, 3.0]) + 0.01 * rng.standard_normal(60)
+    window = 20
+    L = cholesky_decomposition(X[:window].T @ X[:window])
+    Xty = X[:window].T @ y[:window]
+    for i in range(window, 60):
+        L = cholesky_update(L, X[i], overwrite_l=True)
+        L = cholesky_update(L, X[i - window], downdate=True, overwrite_l=True)
+        Xty += X[i] * y[i] - X[i - window] * y[i - window]
+        rows = slice(i - window + 1, i + 1)
+        expected = np.linalg.lstsq(X[rows], y[rows], rcond=None)[0]
+        assert np.allclose(cholesky_solve(L, Xty), expected)
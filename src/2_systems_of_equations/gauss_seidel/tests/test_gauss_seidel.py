@@ -1,6 +1,9 @@
 import pytest
 import numpy as np
+import scipy.sparse as sp
 from ..implementation.gauss_seidel import (
+    estimate_sor_omega,
+    red_black_coloring,
     inverse_matrix,
     solve_inverse_matrix,
     gauss_seidel,
@@ -122,3 +125,70 @@ def test_inverse_matrix_3x3_gauss_seidel():
     A = np.array([[1, 2, 3], [0, 1, 4], [5, 6, 0]], dtype=float)
     A_inv = inverse_matrix(A)
     assert np.allclose(A @ A_inv, np.eye(3), atol=1e-10)
+
+
+def poisson_2d(m):
+    T = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sp.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    return sp.csr_matrix(sp.kron(sp.eye(m), T) + sp.kron(S, sp.eye(m)))
+
+
+def test_gauss_seidel_sparse_matches_dense():
+    A = poisson_2d(6)
+    b = np.linspace(1.0, 2.0, 36)
+    x_sparse = gauss_seidel(A, b, epsilon=1e-12, max_iter=1000)
+    x_dense = gauss_seidel(A.toarray(), b, epsilon=1e-12, max_iter=1000)
+    assert np.allclose(x_sparse, x_dense, atol=1e-10)
+    assert np.allclose(A @ x_sparse, b, atol=1e-9)
+
+
+def test_gauss_seidel_sor_auto_omega():
+    A = poisson_2d(30)
+    b = np.ones(900)
+    omega = estimate_sor_omega(A)
+    assert np.isclose(omega, 2 / (1 + np.sin(np.pi / 31)), atol=1e-2)
+    with pytest.raises(ValueError):
+        gauss_seidel(A, b, max_iter=300)
+    x = gauss_seidel(A, b, max_iter=300, omega="auto")
+    assert np.allclose(A @ x, b, atol=1e-6)
+
+
+@pytest.mark.parametrize("omega", [1.0, "auto"])
+def test_gauss_seidel_red_black(omega):
+    A = poisson_2d(20)
+    b = np.random.default_rng(0).normal(size=400)
+    x = gauss_seidel(
+        A, b, epsilon=1e-10, max_iter=2000, omega=omega, ordering="red_black"
+    )
+    assert np.allclose(x, sp.linalg.spsolve(sp.csc_matrix(A), b), atol=1e-8)
+
+
+def test_gauss_seidel_red_black_dense():
+    A = np.array([[4, -1, 0], [-1, 4, -1], [0, -1, 4]], dtype=float)
+    b = np.array([1.0, 2.0, 3.0])
+    x = gauss_seidel(A, b, epsilon=1e-12, ordering="red_black")
+    assert np.allclose(x, np.linalg.solve(A, b), atol=1e-10)
+
+
+def test_red_black_coloring_checkerboard():
+    red = red_black_coloring(poisson_2d(4)).reshape(4, 4)
+    i, j = np.indices((4, 4))
+    assert np.array_equal(red, ((i + j) % 2 == 0) == red[0, 0])
+
+
+def test_red_black_coloring_not_bipartite():
+    A = np.array([[10, 2, 1], [1, 10, 2], [2, 1, 10]], dtype=float)
+    with pytest.raises(ValueError):
+        red_black_coloring(A)
+
+
+def test_gauss_seidel_unknown_ordering():
+    with pytest.raises(ValueError):
+        gauss_seidel(np.eye(2), np.ones(2), ordering="multicolor")
+
+
+def test_red_black_coloring_keeps_matrix():
+    A = poisson_2d(3)
+    before = A.toarray()
+    red_black_coloring(A)
+    assert np.array_equal(A.toarray(), before)
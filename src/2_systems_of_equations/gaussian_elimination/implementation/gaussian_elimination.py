@@ -25,6 +25,46 @@ def gaussian_elimination(A: np.ndarray, b: np.ndarray) -> np.ndarray:
     return x
 
 
+def gaussian_elimination_batch(
+    A: np.ndarray, b: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve k independent systems A[i] x[i] = b[i] by Gaussian elimination.
+
+    A has shape (k, n, n) and b has shape (k, n) or (k, n, m). Every step of
+    elimination with partial pivoting is applied to all k systems at once, so
+    the Python loops run over n rather than k. Returns the solutions, shaped
+    like b, and a boolean mask of the systems found to be singular or nearly
+    singular; their solutions are NaN.
+    """
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Matrix stack A must have shape (k, n, n).")
+    if b.ndim not in (2, 3) or b.shape[:2] != A.shape[:2]:
+        raise ValueError("Matrix stack A and right-hand sides b do not match.")
+    k, n = A.shape[:2]
+    B = b[..., np.newaxis] if b.ndim == 2 else b
+    augmented: np.ndarray = np.concatenate((A.astype(float), B.astype(float)), axis=2)
+    singular: np.ndarray = np.zeros(k, dtype=bool)
+    systems: np.ndarray = np.arange(k)
+    for i in range(n):
+        pivot: np.ndarray = np.argmax(np.abs(augmented[:, i:, i]), axis=1) + i
+        pivot_row: np.ndarray = augmented[systems, pivot]
+        augmented[systems, pivot] = augmented[:, i]
+        augmented[:, i] = pivot_row
+        singular |= np.isclose(augmented[:, i, i], 0.0)
+        # Singular systems keep being eliminated with a unit pivot and are discarded
+        augmented[:, i, i:] /= np.where(singular, 1.0, augmented[:, i, i])[:, None]
+        factors: np.ndarray = augmented[:, i + 1 :, i : i + 1].copy()
+        augmented[:, i + 1 :, i:] -= factors * augmented[:, i : i + 1, i:]
+    x: np.ndarray = np.zeros(B.shape)
+    for i in range(n - 1, -1, -1):
+        x[:, i] = augmented[:, i, n:] - np.einsum(
+            "kj,kjm->km", augmented[:, i, i + 1 : n], x[:, i + 1 :]
+        )
+    x[singular] = np.nan
+    return (x[..., 0] if b.ndim == 2 else x), singular
+
+
 def solve_gaussian_elimination(A: np.ndarray, b: np.ndarray) -> np.ndarray:
     x = gaussian_elimination(A, b)
     return np.round(x, decimals=8)
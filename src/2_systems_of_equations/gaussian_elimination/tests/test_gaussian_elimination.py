@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from ..implementation.gaussian_elimination import (
     gaussian_elimination,
+    gaussian_elimination_batch,
     solve_gaussian_elimination,
 )
 
@@ -138,3 +139,57 @@ def test_solve_gaussian_elimination_no_solution():
     b = np.array([3, 5], dtype=float)
     with pytest.raises(ValueError):
         solve_gaussian_elimination(A, b)
+
+
+def test_gaussian_elimination_batch_matches_numpy():
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((500, 6, 6))
+    b = rng.standard_normal((500, 6))
+    x, singular = gaussian_elimination_batch(A, b)
+    assert x.shape == (500, 6)
+    assert not singular.any()
+    assert np.allclose(x, np.linalg.solve(A, b[..., None])[..., 0])
+
+
+def test_gaussian_elimination_batch_multiple_right_hand_sides():
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((50, 4, 4))
+    B = rng.standard_normal((50, 4, 3))
+    X, singular = gaussian_elimination_batch(A, B)
+    assert X.shape == (50, 4, 3)
+    assert np.allclose(A @ X, B)
+
+
+def test_gaussian_elimination_batch_needs_pivoting():
+    A = np.array([[[0.0, 1.0], [1.0, 0.0]], [[1e-20, 1.0], [1.0, 1.0]]])
+    b = np.array([[2.0, 3.0], [1.0, 2.0]])
+    x, singular = gaussian_elimination_batch(A, b)
+    assert not singular.any()
+    assert np.allclose(x, [[3.0, 2.0], [1.0, 1.0]])
+
+
+def test_gaussian_elimination_batch_singular_mask():
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((10, 5, 5))
+    A[3] = np.ones((5, 5))
+    A[7, 4] = A[7, 0] + A[7, 1]
+    b = rng.standard_normal((10, 5))
+    x, singular = gaussian_elimination_batch(A, b)
+    assert singular.tolist() == [i in (3, 7) for i in range(10)]
+    assert np.isnan(x[singular]).all()
+    ok = ~singular
+    assert np.allclose(np.einsum("kij,kj->ki", A[ok], x[ok]), b[ok])
+
+
+def test_gaussian_elimination_batch_matches_single():
+    A = np.array([[[2.0, 1.0, -1.0], [-3.0, -1.0, 2.0], [-2.0, 1.0, 2.0]]])
+    b = np.array([[8.0, -11.0, -3.0]])
+    x, _ = gaussian_elimination_batch(A, b)
+    assert np.allclose(x[0], gaussian_elimination(A[0], b[0]))
+
+
+def test_gaussian_elimination_batch_bad_shapes():
+    with pytest.raises(ValueError):
+        gaussian_elimination_batch(np.ones((2, 3, 4)), np.ones((2, 3)))
+    with pytest.raises(ValueError):
+        gaussian_elimination_batch(np.ones((2, 3, 3)), np.ones((3, 3)))
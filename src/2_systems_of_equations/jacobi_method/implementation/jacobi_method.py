@@ -1,10 +1,12 @@
 # jacobi_method.py
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from typing import Optional
+import scipy.sparse as sp
+from typing import Optional, Union
 
 
 def jacobi_method(
-    A: np.ndarray,
+    A: Union[np.ndarray, sp.spmatrix],
     b: np.ndarray,
     x0: Optional[np.ndarray] = None,
     epsilon: float = 1e-8,
@@ -13,20 +15,76 @@ def jacobi_method(
     if A.shape[0] != A.shape[1]:
         raise ValueError("Matrix A must be square.")
     n = A.shape[0]
-    D = np.diag(A)
+    D = A.diagonal()
     if np.any(D == 0):
         raise ValueError("Matrix A has zero diagonal elements.")
-    R = A - np.diagflat(D)
+    # x_new = D^-1 (b - R x) = x + D^-1 (b - A x), so R = A - D is never formed
+    # and a sparse A stays sparse.
     D_inv = 1.0 / D
     if x0 is None:
         x = np.zeros(n)
     else:
         x = x0.astype(float)
     for _ in range(max_iterations):
-        x_new = D_inv * (b - np.dot(R, x))
+        x_new = x + D_inv * (b - A @ x)
         if np.linalg.norm(x_new - x, ord=np.inf) < epsilon:
             return x_new
         x = x_new
     raise ValueError(
         "Jacobi method did not converge within the maximum number of iterations."
     )
+
+
+def jacobi_method_blocked(
+    A: np.ndarray,
+    b: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    epsilon: float = 1e-8,
+    max_iterations: int = 1000,
+    block_size: int = 1024,
+    n_workers: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Jacobi iteration for dense matrices too large for memory, e.g. an np.memmap.
+
+    Each sweep streams A in blocks of block_size rows and computes the block
+    products A[rows] @ x on a pool of n_workers threads (NumPy releases the GIL
+    in the matrix-vector products). At most n_workers row blocks are held in
+    memory at once, so peak memory beyond the O(n) vectors is about
+    n_workers * block_size * n * A.itemsize bytes.
+    """
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1.")
+    n = A.shape[0]
+    starts = range(0, n, block_size)
+    D = np.empty(n)
+    for start in starts:
+        end = min(start + block_size, n)
+        D[start:end] = np.diagonal(A[start:end, start:end])
+    if np.any(D == 0):
+        raise ValueError("Matrix A has zero diagonal elements.")
+    D_inv = 1.0 / D
+    b = np.asarray(b, dtype=float)
+    if x0 is None:
+        x = np.zeros(n)
+    else:
+        x = x0.astype(float)
+    Ax = np.empty(n)
+
+    def block_matvec(start: int) -> None:
+        end = min(start + block_size, n)
+        np.dot(np.asarray(A[start:end]), x, out=Ax[start:end])
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        for _ in range(max_iterations):
+            # list() waits for every block and re-raises any worker exception
+            list(pool.map(block_matvec, starts))
+            x_new = x + D_inv * (b - Ax)
+            if np.linalg.norm(x_new - x, ord=np.inf) < epsilon:
+                return x_new
+            x = x_new
+    raise ValueError(
+        "Jacobi method did not converge within the maximum number of iterations."
+    )
@@ -1,7 +1,8 @@
 # test_jacobi_method.py
 import pytest
 import numpy as np
-from ..implementation.jacobi_method import jacobi_method
+import scipy.sparse as sp
+from ..implementation.jacobi_method import jacobi_method, jacobi_method_blocked
 
 
 def test_jacobi_identity():
@@ -143,3 +144,74 @@ def test_jacobi_non_convergent():
     b = np.array([5, 6], dtype=float)
     with pytest.raises(ValueError):
         jacobi_method(A, b, epsilon=1e-10, max_iterations=50)
+
+
+def test_jacobi_sparse_matrix():
+    n = 100000
+    A = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(n, n), format="csr")
+    b = np.ones(n)
+    x = jacobi_method(A, b, epsilon=1e-10)
+    assert np.allclose(A @ x, b, atol=1e-9)
+
+
+def test_jacobi_sparse_matches_dense():
+    A = np.array([[10, -1, 2], [-1, 11, -1], [2, -1, 10]], dtype=float)
+    b = np.array([6, 25, -11], dtype=float)
+    x_sparse = jacobi_method(sp.csr_matrix(A), b, epsilon=1e-12)
+    x_dense = jacobi_method(A, b, epsilon=1e-12)
+    assert np.allclose(x_sparse, x_dense, atol=1e-12)
+
+
+def diagonally_dominant(n, seed=0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1, 1, (n, n))
+    A += np.diag(np.abs(A).sum(axis=1) + 1.0)
+    return A
+
+
+def test_jacobi_blocked_memmap(tmp_path):
+    n = 300
+    A = diagonally_dominant(n)
+    A_disk = np.memmap(tmp_path / "A.dat", dtype=float, mode="w+", shape=(n, n))
+    A_disk[:] = A
+    A_disk.flush()
+    A_disk = np.memmap(tmp_path / "A.dat", dtype=float, mode="r", shape=(n, n))
+    b = np.arange(n, dtype=float)
+    x = jacobi_method_blocked(A_disk, b, block_size=64, n_workers=4)
+    assert np.allclose(x, np.linalg.solve(A, b), atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "block_size, n_workers", [(1, 1), (7, 2), (50, None), (500, 3)]
+)
+def test_jacobi_blocked_matches_jacobi(block_size, n_workers):
+    A = diagonally_dominant(50, seed=1)
+    b = np.ones(50)
+    x = jacobi_method_blocked(A, b, block_size=block_size, n_workers=n_workers)
+    assert np.allclose(x, jacobi_method(A, b))
+
+
+def test_jacobi_blocked_float32_matrix():
+    A = diagonally_dominant(40, seed=2)
+    b = np.ones(40)
+    x = jacobi_method_blocked(A.astype(np.float32), b, block_size=16)
+    assert np.allclose(x, np.linalg.solve(A.astype(np.float32), b), atol=1e-6)
+
+
+def test_jacobi_blocked_zero_diagonal():
+    A = np.array([[0.0, 1.0], [1.0, 2.0]])
+    with pytest.raises(ValueError):
+        jacobi_method_blocked(A, np.ones(2))
+
+
+def test_jacobi_blocked_non_convergent():
+    A = np.array([[1.0, 2.0], [3.0, 1.0]])
+    with pytest.raises(ValueError):
+        jacobi_method_blocked(A, np.ones(2), max_iterations=50)
+
+
+def test_jacobi_blocked_invalid_arguments():
+    with pytest.raises(ValueError):
+        jacobi_method_blocked(np.ones((2, 3)), np.ones(2))
+    with pytest.raises(ValueError):
+        jacobi_method_blocked(np.eye(2), np.ones(2), block_size=0)
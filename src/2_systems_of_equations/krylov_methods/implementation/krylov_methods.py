@@ -0,0 +1,300 @@
+# krylov_methods.py
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+from typing import Callable, Dict, Optional, Tuple, Union
+
+Operator = Union[np.ndarray, sp.spmatrix, Callable[[np.ndarray], np.ndarray]]
+Preconditioner = Union[None, str, Callable[[np.ndarray], np.ndarray]]
+
+
+def _as_matvec(A: Operator) -> Callable[[np.ndarray, np.ndarray], None]:
+    """Return a function computing A @ v into a preallocated output vector."""
+    if isinstance(A, np.ndarray):
+        return lambda v, out: np.dot(A, v, out=out)
+
+    def matvec(v: np.ndarray, out: np.ndarray) -> None:
+        out[...] = A @ v if sp.issparse(A) else A(v)
+
+    return matvec
+
+
+def jacobi_preconditioner(A: Union[np.ndarray, sp.spmatrix]) -> Callable:
+    D = A.diagonal().astype(float)
+    if np.any(D == 0):
+        raise ValueError("Matrix A has zero diagonal elements.")
+    D_inv = 1.0 / D
+    return lambda r: D_inv * r
+
+
+def incomplete_cholesky(A: Union[np.ndarray, sp.spmatrix]) -> Callable:
+    """
+    Zero fill-in incomplete Cholesky factorization L L^T ~ A of an SPD matrix.
+
+    L keeps the sparsity pattern of the lower triangle of A and is built column
+    by column on its CSC arrays: column k is scaled by L[k, k], then every
+    product L[i, k] L[j, k] whose position (i, j) lies in the pattern is
+    subtracted in one vectorized step. L is handed to SuperLU once, without
+    reordering or pivoting, and the returned function applies (L L^T)^-1 by
+    the two triangular solves of that factorization.
+    """
+    lower = sp.csc_matrix(sp.tril(A), dtype=float)
+    lower.sort_indices()
+    n = lower.shape[0]
+    indptr, indices, data = lower.indptr, lower.indices, lower.data
+    # entries are stored by column, then row, so these keys are increasing
+    columns = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    keys = columns * n + indices
+    if not np.array_equal(indices[indptr[:-1][np.diff(indptr) > 0]], np.arange(n)):
+        raise ValueError("Incomplete Cholesky factorization broke down.")
+    pairs: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    for k in range(n):
+        start, end = indptr[k], indptr[k + 1]
+        if data[start] <= 0:
+            raise ValueError("Incomplete Cholesky factorization broke down.")
+        data[start] = np.sqrt(data[start])
+        if end - start == 1:
+            continue
+        data[start + 1 : end] /= data[start]
+        rows = indices[start + 1 : end]
+        column = data[start + 1 : end]
+        m = rows.size
+        if m not in pairs:
+            pairs[m] = np.tril_indices(m)
+        i, j = pairs[m]
+        # A[r_i, r_j] -= L[r_i, k] L[r_j, k] for r_i >= r_j, within the pattern
+        targets = rows[j] * np.int64(n) + rows[i]
+        positions = np.searchsorted(keys, targets)
+        positions[positions == keys.size] = 0
+        found = keys[positions] == targets
+        data[positions[found]] -= column[i[found]] * column[j[found]]
+    factor = splu(lower, permc_spec="NATURAL", diag_pivot_thresh=0.0)
+    return lambda r: factor.solve(factor.solve(np.asarray(r, dtype=float)), trans="T")
+
+
+def _make_preconditioner(A: Operator, preconditioner: Preconditioner) -> Callable:
+    if preconditioner is None:
+        return lambda r: r
+    if callable(preconditioner):
+        return preconditioner
+    if callable(A) and not isinstance(A, np.ndarray) and not sp.issparse(A):
+        raise ValueError("Named preconditioners need A as a matrix.")
+    if preconditioner == "jacobi":
+        return jacobi_preconditioner(A)
+    if preconditioner == "ichol":
+        return incomplete_cholesky(A)
+    raise ValueError(f"Unknown preconditioner '{preconditioner}'.")
+
+
+def _finish(
+    x: np.ndarray, iterations: int, residual_norm: float, return_info: bool
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, float]]]:
+    if return_info:
+        return x, {"iterations": iterations, "residual_norm": residual_norm}
+    return x
+
+
+def conjugate_gradient(
+    A: Operator,
+    b: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    tol: float = 1e-8,
+    max_iterations: Optional[int] = None,
+    preconditioner: Preconditioner = None,
+    return_info: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, float]]]:
+    """
+    (Preconditioned) conjugate gradient method for symmetric positive definite A.
+
+    A may be a dense array, a scipy.sparse matrix or a function returning A @ v.
+    preconditioner is None, "jacobi", "ichol" or a function applying M^-1.
+    Iterates until ||b - A x|| <= tol * ||b||.
+    """
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+    max_iterations = 10 * n if max_iterations is None else max_iterations
+    matvec = _as_matvec(A)
+    M = _make_preconditioner(A, preconditioner)
+
+    x = np.zeros(n) if x0 is None else x0.astype(float)
+    r = np.empty(n)
+    Ap = np.empty(n)
+    work = np.empty(n)
+    matvec(x, Ap)
+    np.subtract(b, Ap, out=r)
+    threshold = tol * np.linalg.norm(b)
+    residual_norm = np.linalg.norm(r)
+    if residual_norm <= threshold:
+        return _finish(x, 0, residual_norm, return_info)
+    z = M(r)
+    p = np.array(z, dtype=float)
+    rz = r @ z
+    for iteration in range(1, max_iterations + 1):
+        matvec(p, Ap)
+        alpha = rz / (p @ Ap)
+        np.multiply(p, alpha, out=work)
+        x += work
+        np.multiply(Ap, alpha, out=work)
+        r -= work
+        residual_norm = np.linalg.norm(r)
+        if residual_norm <= threshold:
+            return _finish(x, iteration, residual_norm, return_info)
+        z = M(r)
+        rz_new = r @ z
+        p *= rz_new / rz
+        p += z
+        rz = rz_new
+    raise ValueError(
+        "Conjugate gradient did not converge within the maximum number of iterations."
+    )
+
+
+def gmres(
+    A: Operator,
+    b: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    tol: float = 1e-8,
+    max_iterations: Optional[int] = None,
+    restart: int = 50,
+    preconditioner: Preconditioner = None,
+    return_info: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, float]]]:
+    """
+    Restarted GMRES(restart) for general nonsingular A, right-preconditioned.
+
+    The Krylov basis, Hessenberg matrix and Givens rotations are allocated once
+    and reused by every restart cycle. max_iterations counts inner iterations.
+    """
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+    max_iterations = 10 * n if max_iterations is None else max_iterations
+    restart = min(restart, n)
+    matvec = _as_matvec(A)
+    M = _make_preconditioner(A, preconditioner)
+
+    x = np.zeros(n) if x0 is None else x0.astype(float)
+    r = np.empty(n)
+    w = np.empty(n)
+    work = np.empty(n)
+    V = np.empty((restart + 1, n))
+    H = np.zeros((restart + 1, restart))
+    cs = np.empty(restart)
+    sn = np.empty(restart)
+    g = np.empty(restart + 1)
+    threshold = tol * np.linalg.norm(b)
+
+    iteration = 0
+    while True:
+        matvec(x, r)
+        np.subtract(b, r, out=r)
+        beta = np.linalg.norm(r)
+        if beta <= threshold:
+            return _finish(x, iteration, beta, return_info)
+        if iteration >= max_iterations:
+            break
+        np.divide(r, beta, out=V[0])
+        g[:] = 0.0
+        g[0] = beta
+        H[:] = 0.0
+        j = 0
+        while j < restart and iteration < max_iterations:
+            iteration += 1
+            # Arnoldi step with modified Gram-Schmidt on A M^-1 v_j
+            matvec(M(V[j]), w)
+            for i in range(j + 1):
+                H[i, j] = w @ V[i]
+                np.multiply(V[i], H[i, j], out=work)
+                w -= work
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] != 0:
+                np.divide(w, H[j + 1, j], out=V[j + 1])
+            # Apply the previous rotations, then eliminate H[j + 1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (
+                    cs[i] * H[i, j] + sn[i] * H[i + 1, j],
+                    -sn[i] * H[i, j] + cs[i] * H[i + 1, j],
+                )
+            denominator = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = H[j, j] / denominator, H[j + 1, j] / denominator
+            H[j, j] = denominator
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] *= cs[j]
+            j += 1
+            if np.abs(g[j]) <= threshold:
+                break
+        # Solve the small triangular system and update x = x + M^-1 V y
+        y = np.linalg.solve(np.triu(H[:j, :j]), g[:j])
+        x += M(V[:j].T @ y)
+    raise ValueError("GMRES did not converge within the maximum number of iterations.")
+
+
+def bicgstab(
+    A: Operator,
+    b: np.ndarray,
+    x0: Optional[np.ndarray] = None,
+    tol: float = 1e-8,
+    max_iterations: Optional[int] = None,
+    preconditioner: Preconditioner = None,
+    return_info: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, float]]]:
+    """
+    Preconditioned BiCGSTAB for general nonsingular A.
+
+    Needs two products with A per iteration and only a fixed set of vectors.
+    """
+    b = np.asarray(b, dtype=float)
+    n = b.shape[0]
+    max_iterations = 10 * n if max_iterations is None else max_iterations
+    matvec = _as_matvec(A)
+    M = _make_preconditioner(A, preconditioner)
+
+    x = np.zeros(n) if x0 is None else x0.astype(float)
+    r = np.empty(n)
+    v = np.zeros(n)
+    t = np.empty(n)
+    p = np.zeros(n)
+    work = np.empty(n)
+    matvec(x, r)
+    np.subtract(b, r, out=r)
+    r_hat = r.copy()
+    threshold = tol * np.linalg.norm(b)
+    residual_norm = np.linalg.norm(r)
+    if residual_norm <= threshold:
+        return _finish(x, 0, residual_norm, return_info)
+    rho = alpha = omega = 1.0
+    for iteration in range(1, max_iterations + 1):
+        rho_new = r_hat @ r
+        if rho_new == 0 or omega == 0:
+            raise ValueError(f"BiCGSTAB broke down at iteration {iteration}.")
+        beta = (rho_new / rho) * (alpha / omega)
+        rho = rho_new
+        # p = r + beta (p - omega v)
+        np.multiply(v, omega, out=work)
+        p -= work
+        p *= beta
+        p += r
+        p_hat = M(p)
+        matvec(p_hat, v)
+        alpha = rho / (r_hat @ v)
+        np.multiply(p_hat, alpha, out=work)
+        x += work
+        # s = r - alpha v, stored in r
+        np.multiply(v, alpha, out=work)
+        r -= work
+        residual_norm = np.linalg.norm(r)
+        if residual_norm <= threshold:
+            return _finish(x, iteration, residual_norm, return_info)
+        s_hat = M(r)
+        matvec(s_hat, t)
+        omega = (t @ r) / (t @ t)
+        np.multiply(s_hat, omega, out=work)
+        x += work
+        np.multiply(t, omega, out=work)
+        r -= work
+        residual_norm = np.linalg.norm(r)
+        if residual_norm <= threshold:
+            return _finish(x, iteration, residual_norm, return_info)
+    raise ValueError(
+        "BiCGSTAB did not converge within the maximum number of iterations."
+    )
@@ -0,0 +1,136 @@
+# test_krylov_methods.py
+import pytest
+import numpy as np
+import scipy.sparse as sp
+from ..implementation.krylov_methods import (
+    bicgstab,
+    conjugate_gradient,
+    gmres,
+    incomplete_cholesky,
+    jacobi_preconditioner,
+)
+
+
+def poisson_2d(m):
+    T = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(m, m))
+    S = sp.diags([-1.0, -1.0], [-1, 1], shape=(m, m))
+    return sp.csr_matrix(sp.kron(sp.eye(m), T) + sp.kron(S, sp.eye(m)))
+
+
+def convection_diffusion(m):
+    # nonsymmetric, from central differences of -u'' + c u' + u
+    return sp.diags([-1.2, 3.0, -0.8], [-1, 0, 1], shape=(m, m), format="csr")
+
+
+SOLVERS = [conjugate_gradient, gmres, bicgstab]
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_krylov_dense_spd(solver):
+    rng = np.random.default_rng(0)
+    Q = rng.normal(size=(20, 20))
+    A = Q @ Q.T + 20 * np.eye(20)
+    b = rng.normal(size=20)
+    x = solver(A, b, tol=1e-10)
+    assert np.allclose(x, np.linalg.solve(A, b), atol=1e-8)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_krylov_sparse(solver):
+    A = poisson_2d(30)
+    b = np.ones(900)
+    x = solver(A, b, tol=1e-10)
+    assert np.linalg.norm(A @ x - b) <= 1e-9 * np.linalg.norm(b)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_krylov_matrix_free(solver):
+    n = 500
+
+    def matvec(v):
+        out = 2.5 * v
+        out[1:] -= v[:-1]
+        out[:-1] -= v[1:]
+        return out
+
+    A = sp.diags([-1.0, 2.5, -1.0], [-1, 0, 1], shape=(n, n))
+    b = np.linspace(-1.0, 1.0, n)
+    x = solver(matvec, b, tol=1e-10)
+    assert np.allclose(A @ x, b, atol=1e-8)
+
+
+@pytest.mark.parametrize("solver", [gmres, bicgstab])
+def test_krylov_nonsymmetric(solver):
+    A = convection_diffusion(200)
+    b = np.ones(200)
+    x = solver(A, b, tol=1e-10, preconditioner="jacobi")
+    assert np.allclose(A @ x, b, atol=1e-8)
+
+
+def test_conjugate_gradient_iterations_vs_jacobi_bound():
+    A = poisson_2d(40)
+    b = np.ones(1600)
+    _, info = conjugate_gradient(A, b, tol=1e-8, return_info=True)
+    # Jacobi contracts by cos(pi / 41) per sweep, i.e. about 6000 sweeps here
+    jacobi_sweeps = np.log(1e-8) / np.log(np.cos(np.pi / 41))
+    assert info["iterations"] < 200 < jacobi_sweeps
+
+
+@pytest.mark.parametrize("preconditioner", ["jacobi", "ichol"])
+def test_conjugate_gradient_preconditioned(preconditioner):
+    m = 40
+    A = poisson_2d(m) + sp.diags(np.linspace(0.0, 50.0, m * m))
+    b = np.ones(m * m)
+    _, plain = conjugate_gradient(A, b, return_info=True)
+    x, info = conjugate_gradient(A, b, preconditioner=preconditioner, return_info=True)
+    assert np.linalg.norm(A @ x - b) <= 1e-8 * np.linalg.norm(b)
+    assert info["iterations"] < plain["iterations"]
+
+
+def test_incomplete_cholesky_exact_for_tridiagonal():
+    A = sp.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(50, 50))
+    apply_inverse = incomplete_cholesky(A)
+    b = np.arange(50.0)
+    assert np.allclose(A @ apply_inverse(b), b)
+
+
+def test_incomplete_cholesky_not_spd():
+    A = np.array([[1.0, 2.0], [2.0, 1.0]])
+    with pytest.raises(ValueError):
+        incomplete_cholesky(A)
+
+
+def test_jacobi_preconditioner_zero_diagonal():
+    with pytest.raises(ValueError):
+        jacobi_preconditioner(np.array([[0.0, 1.0], [1.0, 0.0]]))
+
+
+def test_gmres_restart():
+    A = convection_diffusion(300)
+    b = np.ones(300)
+    x, info = gmres(A, b, restart=10, tol=1e-10, return_info=True)
+    assert np.allclose(A @ x, b, atol=1e-8)
+    assert info["iterations"] > 10
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_krylov_zero_rhs(solver):
+    x = solver(np.eye(3), np.zeros(3))
+    assert np.array_equal(x, np.zeros(3))
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_krylov_not_converged(solver):
+    A = poisson_2d(20)
+    with pytest.raises(ValueError):
+        solver(A, np.ones(400), max_iterations=3)
+
+
+def test_krylov_named_preconditioner_needs_matrix():
+    with pytest.raises(ValueError):
+        conjugate_gradient(lambda v: v, np.ones(3), preconditioner="jacobi")
+
+
+def test_krylov_unknown_preconditioner():
+    with pytest.raises(ValueError):
+        conjugate_gradient(np.eye(3), np.ones(3), preconditioner="ilu")
@@ -1,6 +1,9 @@
 # lu_decomposition.py
+import hashlib
+from collections import OrderedDict
 import numpy as np
-from typing import Tuple
+from scipy.linalg import solve_triangular
+from typing import Dict, Hashable, Optional, Tuple, Union
 
 
 def lu_decomposition(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -27,13 +30,199 @@ def lu_decomposition(A: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]
     return P, L, U
 
 
+def lu_decomposition_blocked(
+    A: np.ndarray,
+    block_size: int = 64,
+    overwrite_a: bool = False,
+    dtype: type = np.float64,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Right-looking blocked LU decomposition with partial pivoting.
+
+    L (unit diagonal, not stored) and U are packed into a single array of the
+    given floating dtype, which overwrites A when overwrite_a is True and A
+    already has that dtype. The row permutation is returned as an integer
+    vector piv with A[piv] = L @ U. Each block of columns is factored with
+    rank-one updates, after which the trailing submatrix is updated with one
+    matrix-matrix product.
+    """
+    n: int = A.shape[0]
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    if overwrite_a and A.dtype == dtype:
+        LU: np.ndarray = A
+    else:
+        LU = A.astype(dtype)
+    piv: np.ndarray = np.arange(n)
+    for k in range(0, n, block_size):
+        end: int = min(k + block_size, n)
+        # Factor the panel LU[k:, k:end]
+        for i in range(k, end):
+            pivot: int = np.argmax(np.abs(LU[i:, i])) + i
+            if np.isclose(LU[pivot, i], 0.0):
+                raise ValueError("Matrix is singular.")
+            if pivot != i:
+                LU[[i, pivot]] = LU[[pivot, i]]
+                piv[[i, pivot]] = piv[[pivot, i]]
+            LU[i + 1 :, i] /= LU[i, i]
+            LU[i + 1 :, i + 1 : end] -= np.outer(LU[i + 1 :, i], LU[i, i + 1 : end])
+        if end < n:
+            # U12 = L11^-1 A12, then A22 -= L21 @ U12
+            LU[k:end, end:] = solve_triangular(
+                LU[k:end, k:end], LU[k:end, end:], lower=True, unit_diagonal=True
+            )
+            LU[end:, end:] -= LU[end:, k:end] @ LU[k:end, end:]
+    return piv, LU
+
+
 def solve_lu(P: np.ndarray, L: np.ndarray, U: np.ndarray, b: np.ndarray) -> np.ndarray:
-    Pb: np.ndarray = P @ b
-    y: np.ndarray = np.zeros_like(b, dtype=float)
-    n: int = L.shape[0]
-    for i in range(n):
-        y[i] = Pb[i] - np.dot(L[i, :i], y[:i])
-    x: np.ndarray = np.zeros_like(b, dtype=float)
-    for i in range(n - 1, -1, -1):
-        x[i] = (y[i] - np.dot(U[i, i + 1 :], x[i + 1 :])) / U[i, i]
+    # P is either a permutation matrix or a pivot vector from lu_decomposition_blocked
+    Pb: np.ndarray = b[P] if P.ndim == 1 else P @ b
+    # Solve in the precision of the factors (float32 factors give float32 solves)
+    dtype = np.promote_types(L.dtype, np.float32)
+    y: np.ndarray = solve_triangular(
+        L, Pb.astype(dtype), lower=True, unit_diagonal=True
+    )
+    return solve_triangular(U, y, lower=False)
+
+
+def solve_lu_packed(piv: np.ndarray, LU: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return solve_lu(piv, LU, LU, b)
+
+
+def _backward_error(
+    A: np.ndarray, A_norm: float, x: np.ndarray, b: np.ndarray
+) -> float:
+    """Normwise backward error ||b - A x|| / (||A|| ||x|| + ||b||) in the inf-norm."""
+    r_norm = np.atleast_1d(np.max(np.abs(b - A @ x), axis=0))
+    scale = A_norm * np.max(np.abs(x), axis=0) + np.max(np.abs(b), axis=0)
+    ratio = np.divide(r_norm, scale, out=np.zeros_like(r_norm), where=scale > 0)
+    return float(np.max(ratio))
+
+
+def solve_mixed_precision(
+    A: np.ndarray,
+    b: np.ndarray,
+    tol: Optional[float] = None,
+    max_refinements: int = 10,
+    block_size: int = 64,
+    return_info: bool = False,
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, Union[int, float, bool]]]]:
+    """
+    Solve A x = b by a float32 LU factorization and float64 iterative refinement.
+
+    The factorization runs in single precision, then each refinement step
+    computes the residual b - A x in double precision and solves for a
+    correction with the single-precision factors. Refinement stops once the
+    normwise backward error is at most tol, which defaults to sqrt(n) times
+    the float64 machine epsilon. If A cannot be factored in float32, or if
+    refinement stalls (the backward error fails to halve) or runs out of
+    steps, the system is refactored and solved in float64 instead.
+
+    With return_info=True a dict with the number of refinement steps, the
+    final backward error and whether the float64 fallback was used is also
+    returned. b may be a vector or an (n, m) block of right-hand sides.
+    """
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("Matrix A must be square.")
+    if A.shape[0] != b.shape[0]:
+        raise ValueError("Matrix A and vector b dimensions do not match.")
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    n: int = A.shape[0]
+    if tol is None:
+        tol = np.sqrt(n) * np.finfo(float).eps
+    A_norm: float = float(np.max(np.sum(np.abs(A), axis=1))) if n else 0.0
+    refinements: int = 0
+    fallback: bool = True
+    with np.errstate(over="ignore", invalid="ignore"):
+        A_single = A.astype(np.float32)
+    if np.all(np.isfinite(A_single)):
+        try:
+            piv, LU = lu_decomposition_blocked(
+                A_single, block_size=block_size, overwrite_a=True, dtype=np.float32
+            )
+        except ValueError:
+            LU = None
+        if LU is not None:
+            x = solve_lu_packed(piv, LU, b.astype(np.float32)).astype(float)
+            error = _backward_error(A, A_norm, x, b)
+            while refinements < max_refinements and tol < error < np.inf:
+                r = (b - A @ x).astype(np.float32)
+                x += solve_lu_packed(piv, LU, r)
+                refinements += 1
+                previous, error = error, _backward_error(A, A_norm, x, b)
+                if error > 0.5 * previous:
+                    break
+            fallback = not error <= tol
+    if fallback:
+        piv, LU = lu_decomposition_blocked(A, block_size=block_size)
+        x = solve_lu_packed(piv, LU, b)
+        error = _backward_error(A, A_norm, x, b)
+    if return_info:
+        info = {
+            "refinements": refinements,
+            "backward_error": error,
+            "fallback": fallback,
+        }
+        return x, info
     return x
+
+
+def matrix_key(A: np.ndarray) -> Tuple[Tuple[int, ...], str, bytes]:
+    """Content hash of A, together with its shape and dtype."""
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(A.view(np.uint8), digest_size=16).digest()
+    return A.shape, A.dtype.str, digest
+
+
+class LUCache:
+    """
+    Least-recently-used cache of LU factorizations.
+
+    Factorizations are keyed by a content hash of the matrix (see matrix_key)
+    or by a key supplied by the caller, which skips hashing altogether. At most
+    maxsize factorizations are kept; the least recently used one is evicted
+    first. Solving against a cached matrix then costs O(n^2) per right-hand
+    side instead of O(n^3).
+    """
+
+    def __init__(self, maxsize: int = 8, block_size: int = 64):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.block_size = block_size
+        self.hits = 0
+        self.misses = 0
+        self._factorizations: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._factorizations)
+
+    def factorize(
+        self, A: np.ndarray, key: Optional[Hashable] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (piv, LU) factorization of A, computing it on a cache miss."""
+        if key is None:
+            key = matrix_key(A)
+        factorization = self._factorizations.get(key)
+        if factorization is not None:
+            self.hits += 1
+            self._factorizations.move_to_end(key)
+            return factorization
+        self.misses += 1
+        factorization = lu_decomposition_blocked(A, block_size=self.block_size)
+        self._factorizations[key] = factorization
+        if len(self._factorizations) > self.maxsize:
+            self._factorizations.popitem(last=False)
+        return factorization
+
+    def solve(
+        self, A: np.ndarray, b: np.ndarray, key: Optional[Hashable] = None
+    ) -> np.ndarray:
+        """Solve A x = b; b may be a vector or an (n, m) block of right-hand sides."""
+        piv, LU = self.factorize(A, key)
+        return solve_lu_packed(piv, LU, b)
+
+    def clear(self) -> None:
+        self._factorizations.clear()
@@ -1,7 +1,15 @@
 # test_lu_decomposition.py
 import pytest
 import numpy as np
-from ..implementation.lu_decomposition import lu_decomposition, solve_lu
+from ..implementation.lu_decomposition import (
+    LUCache,
+    matrix_key,
+    lu_decomposition,
+    lu_decomposition_blocked,
+    solve_lu,
+    solve_lu_packed,
+    solve_mixed_precision,
+)
 
 
 def test_lu_decomposition_identity():
@@ -139,3 +147,189 @@ def test_solve_lu_no_solution():
     with pytest.raises(ValueError):
         P, L, U = lu_decomposition(A)
         solve_lu(P, L, U, b)
+
+
+@pytest.mark.parametrize("n, block_size", [(1, 4), (7, 3), (64, 64), (150, 32)])
+def test_lu_decomposition_blocked_reconstruction(n, block_size):
+    rng = np.random.default_rng(n)
+    A = rng.normal(size=(n, n))
+    piv, LU = lu_decomposition_blocked(A, block_size=block_size)
+    L = np.tril(LU, -1) + np.eye(n)
+    U = np.triu(LU)
+    assert piv.dtype.kind == "i"
+    assert np.array_equal(np.sort(piv), np.arange(n))
+    assert np.allclose(L @ U, A[piv], atol=1e-10)
+    assert np.all(np.abs(L) <= 1.0 + 1e-12)
+
+
+def test_lu_decomposition_blocked_matches_unblocked():
+    np.random.seed(0)
+    A = np.random.rand(20, 20)
+    P, L, U = lu_decomposition(A)
+    piv, LU = lu_decomposition_blocked(A, block_size=6)
+    assert np.allclose(np.triu(LU), U, atol=1e-10)
+    assert np.allclose(np.tril(LU, -1) + np.eye(20), L, atol=1e-10)
+
+
+def test_lu_decomposition_blocked_overwrite():
+    rng = np.random.default_rng(2)
+    A = rng.normal(size=(10, 10))
+    original = A.copy()
+    piv, LU = lu_decomposition_blocked(A, overwrite_a=True)
+    assert LU is A
+    b = rng.normal(size=10)
+    assert np.allclose(original @ solve_lu_packed(piv, LU, b), b)
+
+
+def test_lu_decomposition_blocked_keeps_input():
+    A = np.array([[1, 3], [2, 1]])
+    lu_decomposition_blocked(A, overwrite_a=True)
+    assert np.array_equal(A, [[1, 3], [2, 1]])
+
+
+def test_solve_lu_pivot_vector():
+    rng = np.random.default_rng(3)
+    A = rng.normal(size=(100, 100))
+    b = rng.normal(size=100)
+    piv, LU = lu_decomposition_blocked(A, block_size=16)
+    x = solve_lu(piv, LU, LU, b)
+    assert np.allclose(x, np.linalg.solve(A, b), atol=1e-8)
+
+
+def test_solve_lu_packed_multiple_rhs():
+    rng = np.random.default_rng(4)
+    A = rng.normal(size=(30, 30))
+    B = rng.normal(size=(30, 5))
+    piv, LU = lu_decomposition_blocked(A, block_size=8)
+    X = solve_lu_packed(piv, LU, B)
+    assert np.allclose(A @ X, B, atol=1e-8)
+
+
+def test_lu_decomposition_blocked_singular():
+    A = np.array([[1, 2, 3], [2, 4, 6], [1, 0, 1]], dtype=float)
+    with pytest.raises(ValueError):
+        lu_decomposition_blocked(A, block_size=2)
+
+
+def test_lu_decomposition_blocked_non_square():
+    with pytest.raises(ValueError):
+        lu_decomposition_blocked(np.ones((2, 3)))
+
+
+def test_lu_cache_reuses_factorization():
+    rng = np.random.default_rng(5)
+    A = rng.normal(size=(40, 40))
+    cache = LUCache(maxsize=2)
+    for _ in range(3):
+        b = rng.normal(size=40)
+        assert np.allclose(A @ cache.solve(A, b), b, atol=1e-8)
+    assert cache.misses == 1
+    assert cache.hits == 2
+
+
+def test_lu_cache_content_key():
+    A = np.arange(9.0).reshape(3, 3) + 10 * np.eye(3)
+    assert matrix_key(A) == matrix_key(A.copy())
+    B = A.copy()
+    B[0, 0] += 1e-12
+    assert matrix_key(A) != matrix_key(B)
+    assert matrix_key(A) != matrix_key(A.astype(np.float32))
+
+
+def test_lu_cache_block_of_right_hand_sides():
+    rng = np.random.default_rng(6)
+    A = rng.normal(size=(25, 25))
+    B = rng.normal(size=(25, 7))
+    X = LUCache().solve(A, B)
+    assert X.shape == (25, 7)
+    assert np.allclose(A @ X, B, atol=1e-8)
+
+
+def test_lu_cache_eviction():
+    rng = np.random.default_rng(7)
+    matrices = [rng.normal(size=(5, 5)) for _ in range(3)]
+    cache = LUCache(maxsize=2)
+    cache.factorize(matrices[0])
+    cache.factorize(matrices[1])
+    cache.factorize(matrices[0])
+    cache.factorize(matrices[2])
+    assert len(cache) == 2
+    cache.factorize(matrices[0])
+    assert cache.misses == 3
+    cache.factorize(matrices[1])
+    assert cache.misses == 4
+
+
+def test_lu_cache_user_key():
+    rng = np.random.default_rng(8)
+    A = rng.normal(size=(6, 6))
+    cache = LUCache()
+    b = rng.normal(size=6)
+    x = cache.solve(A, b, key="covariance")
+    # the user key is trusted, so the matrix is not hashed again
+    assert np.allclose(cache.solve(np.zeros((6, 6)), b, key="covariance"), x)
+    assert cache.hits == 1
+
+
+def test_lu_cache_invalid_size():
+    with pytest.raises(ValueError):
+        LUCache(maxsize=0)
+
+
+def test_lu_decomposition_blocked_float32():
+    A = np.random.default_rng(10).standard_normal((20, 20))
+    piv, LU = lu_decomposition_blocked(A, block_size=8, dtype=np.float32)
+    assert LU.dtype == np.float32
+    L = np.tril(LU, -1) + np.eye(20)
+    assert np.allclose(A[piv], L @ np.triu(LU), atol=1e-5)
+
+
+def test_solve_mixed_precision_reaches_double_accuracy():
+    rng = np.random.default_rng(11)
+    A = rng.standard_normal((100, 100)) + 10 * np.eye(100)
+    x_true = rng.standard_normal(100)
+    x, info = solve_mixed_precision(A, A @ x_true, return_info=True)
+    assert not info["fallback"]
+    assert 1 <= info["refinements"] <= 5
+    assert info["backward_error"] <= 10 * np.finfo(float).eps
+    assert x.dtype == np.float64
+    assert np.allclose(x, x_true, rtol=1e-12, atol=1e-12)
+
+
+def test_solve_mixed_precision_multiple_right_hand_sides():
+    rng = np.random.default_rng(12)
+    A = rng.standard_normal((30, 30)) + 5 * np.eye(30)
+    B = rng.standard_normal((30, 4))
+    X = solve_mixed_precision(A, B)
+    assert X.shape == (30, 4)
+    assert np.allclose(A @ X, B, atol=1e-12)
+
+
+def test_solve_mixed_precision_falls_back_when_refinement_stalls():
+    # cond(A) ~ 1e9 is far beyond float32, so refinement cannot converge
+    n = 12
+    Q = np.linalg.qr(np.random.default_rng(13).standard_normal((n, n)))[0]
+    A = Q @ np.diag(np.logspace(4, -5, n)) @ Q.T
+    b = A @ np.ones(n)
+    x, info = solve_mixed_precision(A, b, return_info=True)
+    assert info["fallback"]
+    assert info["backward_error"] <= 10 * np.finfo(float).eps
+
+
+def test_solve_mixed_precision_falls_back_on_float32_overflow():
+    A = np.array([[1e300, 1.0], [1.0, 1e300]])
+    b = np.array([1e300, 1e300])
+    x, info = solve_mixed_precision(A, b, return_info=True)
+    assert info["fallback"]
+    assert info["refinements"] == 0
+    assert np.allclose(x, [1.0, 1.0])
+
+
+def test_solve_mixed_precision_singular():
+    with pytest.raises(ValueError):
+        solve_mixed_precision(np.ones((3, 3)), np.ones(3))
+
+
+def test_solve_mixed_precision_dimension_mismatch():
+    with pytest.raises(ValueError):
+        solve_mixed_precision(np.eye(3), np.ones(2))
@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Any
+from typing import Any, Optional, Sequence
 
 
 def inverse_matrix(A: np.ndarray) -> np.ndarray:
@@ -21,3 +21,110 @@ def solve_inverse_matrix(A: np.ndarray, b: np.ndarray) -> np.ndarray:
     A_inv: np.ndarray = inverse_matrix(A)
     return A_inv @ b
     return A_inv @ b
+
+
+class UpdatableInverse:
+    """
+    Inverse of A kept up to date under low-rank changes of A.
+
+    A rank-k change A + U V^T is applied to the stored inverse with the
+    Sherman-Morrison-Woodbury formula
+
+        (A + U V^T)^-1 = A^-1 - A^-1 U (I + V^T A^-1 U)^-1 V^T A^-1
+
+    in O(n^2 k) instead of the O(n^3) of inverse_matrix. After every update
+    the drift of the inverse is estimated from the residual of a fixed probe
+    vector, error = ||A (A^-1 z) - z|| / ||z|| in the inf-norm, which costs two
+    matrix-vector products. A freshly computed inverse of an ill-conditioned
+    A already has a residual of order cond(A) * eps, which is recorded as
+    baseline_error.
+
+    The inverse is recomputed from scratch, and refreshes incremented, when
+    any of the following holds:
+
+    - error exceeds max(tol, growth_factor * baseline_error)
+    - max_updates updates have been applied since the last refresh
+    - the capacitance matrix I + V^T A^-1 U is singular
+    """
+
+    def __init__(
+        self,
+        A: np.ndarray,
+        tol: float = 1e-8,
+        max_updates: Optional[int] = None,
+        growth_factor: float = 10.0,
+    ):
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("Matrix A must be square.")
+        self.A: np.ndarray = A.astype(float)
+        self.tol = tol
+        self.max_updates = max_updates
+        self.growth_factor = growth_factor
+        self.refreshes = 0
+        self._probe: np.ndarray = np.random.default_rng(0).choice(
+            [-1.0, 1.0], size=A.shape[0]
+        )
+        self._invert()
+
+    def _invert(self) -> None:
+        self.inverse: np.ndarray = inverse_matrix(self.A)
+        self.updates = 0
+        self.error = self._estimate_error()
+        self.baseline_error = self.error
+
+    def refresh(self) -> None:
+        """Recompute the inverse from the current A."""
+        self._invert()
+        self.refreshes += 1
+
+    def _estimate_error(self) -> float:
+        residual = self.A @ (self.inverse @ self._probe) - self._probe
+        return float(np.max(np.abs(residual)))
+
+    def update(self, U: np.ndarray, V: np.ndarray) -> None:
+        """Replace A by A + U V^T; U and V are n-vectors or (n, k) arrays."""
+        U = U.reshape(self.A.shape[0], -1).astype(float)
+        V = V.reshape(self.A.shape[0], -1).astype(float)
+        if U.shape != V.shape:
+            raise ValueError("U and V must have the same shape.")
+        self._apply(U, V, self.inverse @ U, V.T @ self.inverse)
+
+    def update_rows(self, rows: Sequence[int], new_rows: np.ndarray) -> None:
+        """Overwrite the given rows of A, i.e. U = I[:, rows], V^T = new - old."""
+        rows = np.atleast_1d(rows)
+        new_rows = np.reshape(new_rows, (rows.size, self.A.shape[1]))
+        U = np.zeros((self.A.shape[0], rows.size))
+        U[rows, np.arange(rows.size)] = 1.0
+        V_T = new_rows - self.A[rows]
+        self._apply(U, V_T.T, self.inverse[:, rows], V_T @ self.inverse)
+
+    def update_columns(self, columns: Sequence[int], new_columns: np.ndarray) -> None:
+        """Overwrite the given columns of A, i.e. U = new - old, V = I[:, columns]."""
+        columns = np.atleast_1d(columns)
+        new_columns = np.reshape(new_columns, (self.A.shape[0], columns.size))
+        V = np.zeros((self.A.shape[0], columns.size))
+        V[columns, np.arange(columns.size)] = 1.0
+        U = new_columns - self.A[:, columns]
+        self._apply(U, V, self.inverse @ U, self.inverse[columns])
+
+    def _apply(
+        self, U: np.ndarray, V: np.ndarray, AinvU: np.ndarray, VtAinv: np.ndarray
+    ) -> None:
+        self.A += U @ V.T
+        self.updates += 1
+        capacitance = np.eye(U.shape[1]) + V.T @ AinvU
+        try:
+            correction = np.linalg.solve(capacitance, VtAinv)
+        except np.linalg.LinAlgError:
+            self.refresh()
+            return
+        self.inverse -= AinvU @ correction
+        self.error = self._estimate_error()
+        threshold = max(self.tol, self.growth_factor * self.baseline_error)
+        if not self.error <= threshold or (
+            self.max_updates is not None and self.updates >= self.max_updates
+        ):
+            self.refresh()
+
+    def solve(self, b: np.ndarray) -> np.ndarray:
+        return self.inverse @ b
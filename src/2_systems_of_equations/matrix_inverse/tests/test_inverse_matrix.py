@@ -1,6 +1,10 @@
 import pytest
 import numpy as np
-from ..implementation.inverse_matrix import inverse_matrix, solve_inverse_matrix
+from ..implementation.inverse_matrix import (
+    UpdatableInverse,
+    inverse_matrix,
+    solve_inverse_matrix,
+)
 
 
 def test_inverse_matrix_identity():
@@ -99,3 +103,97 @@ def test_solve_inverse_matrix_diagonal():
     x = solve_inverse_matrix(A, b)
     expected = np.array([3.0, 3.0, 3.0])
     assert np.allclose(x, expected)
+
+
+def random_covariance(n, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.standard_normal((3 * n, n))
+    return X.T @ X / (3 * n)
+
+
+def test_updatable_inverse_rank_k_update():
+    rng = np.random.default_rng(1)
+    A = random_covariance(30)
+    inv = UpdatableInverse(A)
+    U = 0.1 * rng.standard_normal((30, 3))
+    V = 0.1 * rng.standard_normal((30, 3))
+    inv.update(U, V)
+    assert np.allclose(inv.inverse, np.linalg.inv(A + U @ V.T))
+    assert inv.refreshes == 0
+    assert inv.error < 1e-10
+
+
+def test_updatable_inverse_rank_one_vectors():
+    A = random_covariance(10, seed=2)
+    u = np.ones(10)
+    inv = UpdatableInverse(A)
+    inv.update(u, u)
+    assert np.allclose(inv.inverse, np.linalg.inv(A + np.outer(u, u)))
+
+
+def test_updatable_inverse_rows_and_columns():
+    rng = np.random.default_rng(3)
+    A = random_covariance(20, seed=3)
+    inv = UpdatableInverse(A)
+    expected = A.copy()
+    for tick in range(10):
+        i = tick % 20
+        new = A[i] + 0.05 * rng.standard_normal(20)
+        new[i] = A[i, i]
+        inv.update_rows([i], new)
+        inv.update_columns([i], new)
+        expected[i] = new
+        expected[:, i] = new
+        assert np.allclose(inv.A, expected)
+        assert np.allclose(inv.inverse, np.linalg.inv(expected))
+    assert inv.updates == 20
+    b = np.arange(20.0)
+    assert np.allclose(inv.solve(b), np.linalg.solve(expected, b))
+
+
+def test_updatable_inverse_refreshes_on_error():
+    A = random_covariance(15, seed=4)
+    inv = UpdatableInverse(A, tol=0.0, growth_factor=0.0)
+    inv.update(np.ones(15), 0.01 * np.ones(15))
+    assert inv.refreshes == 1
+    assert inv.updates == 0
+    assert np.allclose(inv.inverse, np.linalg.inv(A + 0.01))
+
+
+def test_updatable_inverse_max_updates():
+    A = random_covariance(8, seed=5)
+    inv = UpdatableInverse(A, max_updates=3)
+    for _ in range(7):
+        inv.update(0.01 * np.ones(8), np.ones(8))
+    assert inv.refreshes == 2
+    assert inv.updates == 1
+
+
+def test_updatable_inverse_singular_capacitance_refreshes():
+    # Zeroing a row makes A singular: the capacitance matrix is singular too,
+    # and the full refresh it triggers reports the singular matrix.
+    inv = UpdatableInverse(np.eye(3))
+    with pytest.raises(ValueError):
+        inv.update_rows([1], np.zeros(3))
+
+
+def test_updatable_inverse_non_square():
+    with pytest.raises(ValueError):
+        UpdatableInverse(np.ones((2, 3)))
+
+
+def test_updatable_inverse_ill_conditioned_does_not_refresh():
+    # The fresh inverse of a cond ~ 1e8 matrix already misses an absolute
+    # 1e-8 residual; small updates must not be mistaken for drift.
+    n = 200
+    rng = np.random.default_rng(6)
+    Q = np.linalg.qr(rng.standard_normal((n, n)))[0]
+    A = Q @ np.diag(np.logspace(0, -8, n)) @ Q.T
+    inv = UpdatableInverse(A)
+    assert inv.baseline_error > inv.tol
+    for _ in range(5):
+        u = 1e-3 * rng.standard_normal(n)
+        inv.update(u, u)
+    assert inv.refreshes == 0
+    assert inv.updates == 5
+    assert inv.error <= inv.growth_factor * inv.baseline_error
@@ -1,6 +1,12 @@
+import importlib
 from typing import Callable, Optional
 import numpy as np
 
+# Category packages start with a digit, so they are imported by name.
+_forward_difference = importlib.import_module(
+    "3_derivatives.forward_difference.implementation.forward_difference"
+)
+
 
 def backward_difference(
     f: Callable[[float], float], x: float, h: float = 1e-5
@@ -9,11 +15,27 @@ def backward_difference(
 
 
 def backward_difference_gradient(
-    f: Callable[[np.ndarray], float], x: np.ndarray, h: float = 1e-5
+    f: Callable[[np.ndarray], float],
+    x: np.ndarray,
+    h: float = 1e-5,
+    vectorized: bool = False,
+    memory_budget: int = 2 ** 27,
 ) -> np.ndarray:
+    """
+    With vectorized=True, f maps a (k, n) array of points to k values and the
+    points x - h e_i are evaluated in stacks by evaluate_shifted_points.
+    """
     gradient = np.zeros_like(x, dtype=float)
+    if vectorized:
+        x = np.asarray(x, dtype=float)
+        f_x = np.asarray(f(x[np.newaxis]))[0]
+        backward = _forward_difference.evaluate_shifted_points(
+            f, x, (-h,), memory_budget
+        )[0]
+        return (f_x - backward) / h
+    f_x = f(x)
     for i in range(len(x)):
         x_backward = x.copy()
         x_backward[i] -= h
-        gradient[i] = (f(x) - f(x_backward)) / h
+        gradient[i] = (f_x - f(x_backward)) / h
     return gradient
@@ -162,3 +162,12 @@ def test_backward_difference_gradient_high_precision():
     result = backward_difference_gradient(f, x, h=1e-10)
     expected = np.array([4 * x[0] ** 3, 4 * x[1] ** 3])
     assert np.allclose(result, expected, rtol=1e-3)
+
+
+def test_backward_difference_gradient_vectorized_matches_loop():
+    f = lambda points: np.sum(np.arange(1, 21) * points ** 2, axis=-1)
+    x = np.linspace(-1.0, 1.0, 20)
+    expected = backward_difference_gradient(f, x)
+    result = backward_difference_gradient(f, x, vectorized=True)
+    assert np.allclose(result, expected, atol=1e-10)
+    assert np.allclose(result, 2 * np.arange(1, 21) * x, atol=1e-3)
@@ -1,6 +1,13 @@
 # central_difference.py
+import importlib
 from typing import Callable
 import numpy as np
+import scipy.sparse as sp
+
+# Category packages start with a digit, so they are imported by name.
+_forward_difference = importlib.import_module(
+    "3_derivatives.forward_difference.implementation.forward_difference"
+)
 
 
 def central_difference(f: Callable[[float], float], x: float, h: float = 1e-5) -> float:
@@ -8,9 +15,22 @@ def central_difference(f: Callable[[float], float], x: float, h: float = 1e-5) -
 
 
 def central_difference_gradient(
-    f: Callable[[np.ndarray], float], x: np.ndarray, h: float = 1e-5
+    f: Callable[[np.ndarray], float],
+    x: np.ndarray,
+    h: float = 1e-5,
+    vectorized: bool = False,
+    memory_budget: int = 2 ** 27,
 ) -> np.ndarray:
+    """
+    With vectorized=True, f maps a (k, n) array of points to k values and the
+    points x +- h e_i are evaluated in stacks by evaluate_shifted_points.
+    """
     gradient = np.zeros_like(x, dtype=float)
+    if vectorized:
+        forward, backward = _forward_difference.evaluate_shifted_points(
+            f, x, (h, -h), memory_budget
+        )
+        return (forward - backward) / (2 * h)
     for i in range(len(x)):
         x_forward = x.copy()
         x_backward = x.copy()
@@ -18,3 +38,63 @@ def central_difference_gradient(
         x_backward[i] -= h
         gradient[i] = (f(x_forward) - f(x_backward)) / (2 * h)
     return gradient
+
+
+def central_difference_jacobian(
+    F: Callable[[np.ndarray], np.ndarray], x: np.ndarray, h: float = 1e-5
+) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    columns = []
+    for i in range(len(x)):
+        x_forward = x.copy()
+        x_backward = x.copy()
+        x_forward[i] += h
+        x_backward[i] -= h
+        columns.append((np.asarray(F(x_forward)) - np.asarray(F(x_backward))) / (2 * h))
+    return np.column_stack(columns)
+
+
+def _color_columns(sparsity: sp.spmatrix) -> np.ndarray:
+    """Greedily assign colors so that no two columns of one color share a row."""
+    pattern = sp.csc_matrix(sparsity, dtype=bool)
+    # columns are adjacent when they have a nonzero in a common row
+    adjacency = (pattern.T @ pattern).tocsr()
+    colors = np.full(pattern.shape[1], -1)
+    for j in range(pattern.shape[1]):
+        neighbours = adjacency.indices[adjacency.indptr[j] : adjacency.indptr[j + 1]]
+        used = colors[neighbours]
+        taken = np.zeros(used.size + 1, dtype=bool)
+        taken[used[(used >= 0) & (used <= used.size)]] = True
+        colors[j] = np.argmin(taken)
+    return colors
+
+
+def sparse_central_difference_jacobian(
+    F: Callable[[np.ndarray], np.ndarray],
+    sparsity: sp.spmatrix,
+    h: float = 1e-5,
+) -> Callable[[np.ndarray], sp.csr_matrix]:
+    """
+    Build a Jacobian function J(x) for F from the sparsity pattern of its Jacobian.
+
+    Structurally independent columns are grouped by graph coloring and perturbed
+    together, so every call costs 2 evaluations of F per color instead of 2 per
+    column. The result returns a sparse CSR matrix and can be passed directly as
+    the J argument of newton_raphson_system.
+    """
+    pattern = sp.coo_matrix(sparsity)
+    rows, cols = pattern.row, pattern.col
+    colors = _color_columns(pattern)
+    entries = [np.flatnonzero(colors[cols] == c) for c in range(colors.max() + 1)]
+    shape = pattern.shape
+
+    def jacobian(x: np.ndarray) -> sp.csr_matrix:
+        x = np.asarray(x, dtype=float)
+        values = np.zeros(rows.size)
+        for color, selected in enumerate(entries):
+            step = h * (colors == color)
+            difference = (np.asarray(F(x + step)) - np.asarray(F(x - step))) / (2 * h)
+            values[selected] = difference[rows[selected]]
+        return sp.csr_matrix((values, (rows, cols)), shape=shape)
+
+    return jacobian
@@ -1,9 +1,12 @@
 # test_central_difference.py
 import pytest
 import numpy as np
+import scipy.sparse as sp
 from ..implementation.central_difference import (
     central_difference,
     central_difference_gradient,
+    central_difference_jacobian,
+    sparse_central_difference_jacobian,
 )
 
 
@@ -162,3 +165,51 @@ def test_central_difference_gradient_high_precision():
     result = central_difference_gradient(f, x, h=1e-10)
     expected = np.array([4.0, 4.0])
     assert np.allclose(result, expected, rtol=1e-3)
+
+
+def test_central_difference_jacobian():
+    F = lambda x: np.array([x[0] ** 2 * x[1], 5 * x[0] + np.sin(x[1])])
+    x = np.array([1.0, 2.0])
+    result = central_difference_jacobian(F, x)
+    expected = np.array([[4.0, 1.0], [5.0, np.cos(2.0)]])
+    assert np.allclose(result, expected, atol=1e-6)
+
+
+def test_sparse_central_difference_jacobian_banded():
+    n = 10000
+    calls = []
+
+    def F(x):
+        calls.append(1)
+        y = 4 * x ** 2
+        y[1:] -= x[:-1]
+        y[:-1] -= x[1:]
+        return y
+
+    sparsity = sp.diags([1.0, 1.0, 1.0], [-1, 0, 1], shape=(n, n))
+    J = sparse_central_difference_jacobian(F, sparsity)
+    x = np.linspace(0.0, 1.0, n)
+    result = J(x)
+    expected = sp.diags([-np.ones(n - 1), 8 * x, -np.ones(n - 1)], [-1, 0, 1])
+    assert sp.issparse(result)
+    assert abs(result - expected).max() < 1e-6
+    assert len(calls) == 6
+
+
+def test_sparse_central_difference_jacobian_matches_dense():
+    rng = np.random.default_rng(0)
+    sparsity = sp.random(30, 30, density=0.1, random_state=1, format="csr") + sp.eye(30)
+    A = sparsity.toarray() * rng.normal(size=(30, 30))
+    F = lambda x: A @ x + 0.5 * np.tanh(x)
+    x = rng.normal(size=30)
+    result = sparse_central_difference_jacobian(F, sparsity)(x)
+    assert np.allclose(result.toarray(), central_difference_jacobian(F, x), atol=1e-6)
+
+
+def test_central_difference_gradient_vectorized_matches_loop():
+    f = lambda points: np.sum(np.arange(1, 21) * points ** 2, axis=-1)
+    x = np.linspace(-1.0, 1.0, 20)
+    expected = central_difference_gradient(f, x)
+    result = central_difference_gradient(f, x, vectorized=True)
+    assert np.allclose(result, expected, atol=1e-10)
+    assert np.allclose(result, 2 * np.arange(1, 21) * x, atol=1e-6)
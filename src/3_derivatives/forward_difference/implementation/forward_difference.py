@@ -1,5 +1,5 @@
 # forward_difference.py
-from typing import Callable, Optional
+from typing import Callable, Optional, Sequence
 import numpy as np
 
 
@@ -7,12 +7,53 @@ def forward_difference(f: Callable[[float], float], x: float, h: float = 1e-5) -
     return (f(x + h) - f(x)) / h
 
 
+def evaluate_shifted_points(
+    f: Callable[[np.ndarray], np.ndarray],
+    x: np.ndarray,
+    shifts: Sequence[float],
+    memory_budget: int = 2 ** 27,
+) -> np.ndarray:
+    """
+    Values f(x + s e_i) for every shift s and coordinate i, as a (len(shifts), n)
+    array, from stacked calls of f.
+
+    f must map a (k, n) array of points, one per row, to its k values. The
+    shifted points of a chunk of coordinates go to f in a single call, with
+    chunks sized to stay within memory_budget bytes.
+    """
+    x = np.asarray(x, dtype=float)
+    values = np.empty((len(shifts), x.size))
+    chunk = max(1, memory_budget // (len(shifts) * x.size * x.itemsize))
+    for start in range(0, x.size, chunk):
+        rows = np.arange(min(chunk, x.size - start))
+        points = np.repeat(x[np.newaxis], len(shifts) * rows.size, axis=0)
+        # the points of each shift form one block of rows
+        for k, shift in enumerate(shifts):
+            points[k * rows.size + rows, start + rows] += shift
+        values[:, start + rows] = np.asarray(f(points)).reshape(len(shifts), -1)
+    return values
+
+
 def forward_difference_gradient(
-    f: Callable[[np.ndarray], float], x: np.ndarray, h: float = 1e-5
+    f: Callable[[np.ndarray], float],
+    x: np.ndarray,
+    h: float = 1e-5,
+    vectorized: bool = False,
+    memory_budget: int = 2 ** 27,
 ) -> np.ndarray:
+    """
+    With vectorized=True, f maps a (k, n) array of points to k values and the
+    points x + h e_i are evaluated in stacks by evaluate_shifted_points.
+    """
     gradient = np.zeros_like(x, dtype=float)
+    if vectorized:
+        x = np.asarray(x, dtype=float)
+        f_x = np.asarray(f(x[np.newaxis]))[0]
+        forward = evaluate_shifted_points(f, x, (h,), memory_budget)[0]
+        return (forward - f_x) / h
+    f_x = f(x)
     for i in range(len(x)):
         x_forward = x.copy()
         x_forward[i] += h
-        gradient[i] = (f(x_forward) - f(x)) / h
+        gradient[i] = (f(x_forward) - f_x) / h
     return gradient
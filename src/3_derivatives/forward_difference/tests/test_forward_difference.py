@@ -4,6 +4,7 @@ import numpy as np
 from ..implementation.forward_difference import (
     forward_difference,
     forward_difference_gradient,
+    evaluate_shifted_points,
 )
 
 
@@ -162,3 +163,44 @@ def test_forward_difference_gradient_high_precision():
     result = forward_difference_gradient(f, x, h=1e-10)
     expected = np.array([4.0, 4.0])
     assert np.allclose(result, expected, rtol=1e-3)
+
+
+def _quadratic(points):
+    # Vectorized objective: one value per row of a (k, n) array
+    return np.sum(np.arange(1, points.shape[-1] + 1) * points ** 2, axis=-1)
+
+
+def test_forward_difference_gradient_vectorized_matches_loop():
+    x = np.linspace(-1.0, 1.0, 20)
+    expected = forward_difference_gradient(_quadratic, x)
+    result = forward_difference_gradient(_quadratic, x, vectorized=True)
+    assert np.allclose(result, expected, atol=1e-10)
+    assert np.allclose(result, 2 * np.arange(1, 21) * x, atol=1e-3)
+
+
+def test_evaluate_shifted_points_matches_loop():
+    x = np.linspace(-1.0, 1.0, 7)
+    values = evaluate_shifted_points(_quadratic, x, (0.5, -0.25))
+    for k, shift in enumerate((0.5, -0.25)):
+        expected = [_quadratic(x + shift * e) for e in np.eye(7)]
+        assert np.allclose(values[k], expected)
+
+
+def test_evaluate_shifted_points_respects_memory_budget():
+    calls = []
+
+    def f(points):
+        calls.append(points.shape)
+        return _quadratic(points)
+
+    x = np.ones(10)
+    # room for 4 shifted points of 10 float64 values per call
+    values = evaluate_shifted_points(f, x, (1e-5, -1e-5), memory_budget=320)
+    assert values.shape == (2, 10)
+    assert all(shape[0] <= 4 for shape in calls)
+    assert len(calls) == 5
+
+
+def test_evaluate_shifted_points_integer_input():
+    values = evaluate_shifted_points(_quadratic, np.array([1, 2, 3]), (0.5,))
+    assert np.allclose(values, [[37.25, 40.5, 45.75]])
@@ -0,0 +1,158 @@
+# hessian.py
+import importlib
+from typing import Callable, Dict, Optional, Tuple
+import numpy as np
+import scipy.sparse as sp
+
+# Category packages start with a digit, so they are imported by name.
+_central_difference = importlib.import_module(
+    "3_derivatives.central_difference.implementation.central_difference"
+)
+
+
+class FiniteDifferenceHessian:
+    """
+    Central-difference gradient and Hessian of f that share evaluations of f.
+
+    f(x) and the axis points f(x +- h e_i) are cached for the most recent x,
+    so a gradient and a Hessian at the same point cost no more than the
+    Hessian alone. The Hessian uses the symmetric stencil
+
+        H_ii = (f(x + h e_i) - 2 f(x) + f(x - h e_i)) / h^2
+        H_ij = (f(x + h e_i + h e_j) + f(x - h e_i - h e_j) + 2 f(x)
+                - f(x + h e_i) - f(x - h e_i) - f(x + h e_j) - f(x - h e_j)) / (2 h^2)
+
+    which evaluates every point once: n^2 + n + 1 evaluations in total, against
+    4 n^2 for nested central-difference gradients. With a sparsity pattern only
+    the structurally nonzero pairs i < j are evaluated. evaluations counts the
+    calls of f.
+    """
+
+    def __init__(self, f: Callable[[np.ndarray], float], h: float = 1e-4):
+        if h <= 0:
+            raise ValueError("Step size h must be positive.")
+        self.f = f
+        self.h = h
+        self.evaluations = 0
+        self._x: Optional[np.ndarray] = None
+        self._pairs: Dict[Tuple[int, int], float] = {}
+
+    def _evaluate(self, x: np.ndarray) -> float:
+        self.evaluations += 1
+        return self.f(x)
+
+    def _axis_values(self, x: np.ndarray) -> None:
+        if self._x is not None and np.array_equal(x, self._x):
+            return
+        self._x = x.copy()
+        self._pairs = {}
+        self._f_x = self._evaluate(x)
+        self._f_plus = np.empty(x.size)
+        self._f_minus = np.empty(x.size)
+        for i in range(x.size):
+            point = x.copy()
+            point[i] += self.h
+            self._f_plus[i] = self._evaluate(point)
+            point[i] -= 2 * self.h
+            self._f_minus[i] = self._evaluate(point)
+
+    def _pair_value(self, x: np.ndarray, i: int, j: int) -> float:
+        # f(x + h e_i + h e_j) + f(x - h e_i - h e_j)
+        if (i, j) not in self._pairs:
+            point = x.copy()
+            point[[i, j]] += self.h
+            value = self._evaluate(point)
+            point[[i, j]] -= 2 * self.h
+            self._pairs[i, j] = value + self._evaluate(point)
+        return self._pairs[i, j]
+
+    def gradient(self, x: np.ndarray) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        self._axis_values(x)
+        return (self._f_plus - self._f_minus) / (2 * self.h)
+
+    def hessian(
+        self, x: np.ndarray, sparsity: Optional[sp.spmatrix] = None
+    ) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        self._axis_values(x)
+        n = x.size
+        if sparsity is None:
+            pairs = zip(*np.triu_indices(n, 1))
+        else:
+            pattern = sp.coo_matrix(sparsity)
+            upper = pattern.row < pattern.col
+            pairs = set(zip(pattern.row[upper], pattern.col[upper]))
+            lower = pattern.row > pattern.col
+            pairs |= set(zip(pattern.col[lower], pattern.row[lower]))
+        h2 = self.h ** 2
+        axis = self._f_plus + self._f_minus
+        H = np.diag((axis - 2 * self._f_x) / h2)
+        for i, j in pairs:
+            value = self._pair_value(x, i, j) + 2 * self._f_x - axis[i] - axis[j]
+            H[i, j] = H[j, i] = value / (2 * h2)
+        return H
+
+
+def hessian(
+    f: Callable[[np.ndarray], float],
+    x: np.ndarray,
+    h: float = 1e-4,
+    sparsity: Optional[sp.spmatrix] = None,
+) -> np.ndarray:
+    return FiniteDifferenceHessian(f, h).hessian(x, sparsity)
+
+
+def hessian_vector_product(
+    grad_f: Callable[[np.ndarray], np.ndarray],
+    x: np.ndarray,
+    v: np.ndarray,
+    h: float = 1e-5,
+) -> np.ndarray:
+    """
+    Matrix-free H(x) v = (grad_f(x + t v) - grad_f(x - t v)) / (2 t), t = h / ||v||.
+
+    Costs two gradient evaluations whatever the dimension.
+    """
+    x = np.asarray(x, dtype=float)
+    v = np.asarray(v, dtype=float)
+    norm = np.linalg.norm(v)
+    if norm == 0:
+        return np.zeros_like(x)
+    t = h / norm
+    return (np.asarray(grad_f(x + t * v)) - np.asarray(grad_f(x - t * v))) / (2 * t)
+
+
+def hessian_operator(
+    grad_f: Callable[[np.ndarray], np.ndarray], x: np.ndarray, h: float = 1e-5
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Return v -> H(x) v, e.g. as the operator of a Newton-CG inner solve."""
+    x = np.asarray(x, dtype=float).copy()
+    return lambda v: hessian_vector_product(grad_f, x, v, h)
+
+
+def sparse_hessian(
+    grad_f: Callable[[np.ndarray], np.ndarray],
+    sparsity: sp.spmatrix,
+    h: float = 1e-5,
+) -> Callable[[np.ndarray], sp.csr_matrix]:
+    """
+    Build H(x) from the gradient and the sparsity pattern of the Hessian.
+
+    Columns that share no row are grouped by graph coloring and recovered from
+    one Hessian-vector product per color, i.e. two gradient evaluations per
+    color instead of per column. The result is symmetrized on the pattern.
+    """
+    pattern = sp.csr_matrix(sparsity, dtype=bool)
+    # the Hessian is symmetric and its diagonal is always recovered
+    pattern = pattern + pattern.T + sp.eye(pattern.shape[0], dtype=bool)
+    # H is the Jacobian of the gradient
+    jacobian = _central_difference.sparse_central_difference_jacobian(
+        grad_f, pattern, h
+    )
+
+    def hessian_at(x: np.ndarray) -> sp.csr_matrix:
+        H = jacobian(x)
+        return (H + H.T) / 2
+
+    return hessian_at
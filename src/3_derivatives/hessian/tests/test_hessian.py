@@ -0,0 +1,130 @@
+# test_hessian.py
+import pytest
+import numpy as np
+import scipy.sparse as sp
+from ..implementation.hessian import (
+    FiniteDifferenceHessian,
+    hessian,
+    hessian_operator,
+    hessian_vector_product,
+    sparse_hessian,
+)
+
+
+def rosenbrock(x):
+    return np.sum(100.0 * (x[1:] - x[:-1] ** 2) ** 2 + (1 - x[:-1]) ** 2)
+
+
+def rosenbrock_gradient(x):
+    g = np.zeros_like(x)
+    g[:-1] = -400.0 * x[:-1] * (x[1:] - x[:-1] ** 2) - 2 * (1 - x[:-1])
+    g[1:] += 200.0 * (x[1:] - x[:-1] ** 2)
+    return g
+
+
+def rosenbrock_hessian(x):
+    H = np.diag(-400.0 * x[:-1], 1) + np.diag(-400.0 * x[:-1], -1)
+    diagonal = np.zeros_like(x)
+    diagonal[:-1] = 1200.0 * x[:-1] ** 2 - 400.0 * x[1:] + 2
+    diagonal[1:] += 200.0
+    return H + np.diag(diagonal)
+
+
+def test_hessian_quadratic():
+    A = np.array([[4.0, 1.0, 0.5], [1.0, 3.0, -1.0], [0.5, -1.0, 2.0]])
+    f = lambda x: 0.5 * x @ A @ x + x.sum()
+    H = hessian(f, np.array([0.3, -0.2, 1.0]))
+    assert np.allclose(H, A, atol=1e-6)
+    assert np.array_equal(H, H.T)
+
+
+def test_hessian_rosenbrock():
+    x = np.array([1.2, 0.8, -0.5, 1.1])
+    H = hessian(rosenbrock, x)
+    assert np.allclose(H, rosenbrock_hessian(x), rtol=1e-5, atol=1e-4)
+
+
+def test_hessian_evaluation_count():
+    n = 6
+    evaluator = FiniteDifferenceHessian(rosenbrock)
+    evaluator.hessian(np.ones(n))
+    assert evaluator.evaluations == n * n + n + 1
+
+
+def test_gradient_and_hessian_share_evaluations():
+    x = np.array([0.5, -1.0, 2.0])
+    evaluator = FiniteDifferenceHessian(rosenbrock)
+    g = evaluator.gradient(x)
+    assert evaluator.evaluations == 2 * 3 + 1
+    evaluator.hessian(x)
+    assert evaluator.evaluations == 3 * 3 + 3 + 1
+    evaluator.hessian(x)
+    assert evaluator.evaluations == 3 * 3 + 3 + 1
+    assert np.allclose(g, rosenbrock_gradient(x), rtol=1e-6)
+    evaluator.gradient(x + 1.0)
+    assert evaluator.evaluations == 3 * 3 + 3 + 1 + 7
+
+
+def test_hessian_sparsity_skips_pairs():
+    n = 8
+    x = np.linspace(-1.0, 1.0, n)
+    pattern = sp.diags([np.ones(n - 1), np.ones(n), np.ones(n - 1)], [-1, 0, 1])
+    evaluator = FiniteDifferenceHessian(rosenbrock)
+    H = evaluator.hessian(x, sparsity=pattern)
+    assert evaluator.evaluations == 1 + 2 * n + 2 * (n - 1)
+    assert np.allclose(H, rosenbrock_hessian(x), rtol=1e-5, atol=1e-4)
+
+
+def test_hessian_invalid_step():
+    with pytest.raises(ValueError):
+        FiniteDifferenceHessian(rosenbrock, h=0.0)
+
+
+def test_hessian_vector_product():
+    x = np.array([1.2, 0.8, -0.5, 1.1])
+    v = np.array([1.0, -2.0, 0.5, 3.0])
+    calls = []
+
+    def grad(point):
+        calls.append(point)
+        return rosenbrock_gradient(point)
+
+    Hv = hessian_vector_product(grad, x, v)
+    assert len(calls) == 2
+    assert np.allclose(Hv, rosenbrock_hessian(x) @ v, rtol=1e-6)
+    assert np.array_equal(hessian_vector_product(grad, x, np.zeros(4)), np.zeros(4))
+
+
+def test_hessian_operator_in_newton_cg_step():
+    x = np.array([1.2, 0.8, -0.5, 1.1])
+    operator = hessian_operator(rosenbrock_gradient, x)
+    # a few conjugate gradient iterations on H d = -g with the operator only
+    g = rosenbrock_gradient(x)
+    d = np.zeros_like(x)
+    r = -g.copy()
+    p = r.copy()
+    for _ in range(4):
+        Hp = operator(p)
+        alpha = (r @ r) / (p @ Hp)
+        d += alpha * p
+        r_new = r - alpha * Hp
+        p = r_new + (r_new @ r_new) / (r @ r) * p
+        r = r_new
+    assert np.allclose(d, np.linalg.solve(rosenbrock_hessian(x), -g), rtol=1e-4)
+
+
+def test_sparse_hessian_coloring():
+    n = 30
+    x = np.linspace(-1.0, 1.0, n)
+    pattern = sp.diags([np.ones(n - 1), np.ones(n - 1)], [-1, 1])
+    calls = []
+
+    def grad(point):
+        calls.append(point)
+        return rosenbrock_gradient(point)
+
+    H = sparse_hessian(grad, pattern)(x)
+    assert sp.issparse(H)
+    # a tridiagonal pattern needs three colors, so six gradient evaluations
+    assert len(calls) == 6
+    assert np.allclose(H.toarray(), rosenbrock_hessian(x), rtol=1e-6, atol=1e-6)
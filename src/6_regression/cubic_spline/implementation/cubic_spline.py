@@ -1,8 +1,15 @@
 import numpy as np
 import bisect
+import importlib
 from typing import Callable
 
 
+# Category packages start with a digit, so they are imported by name.
+_banded_systems = importlib.import_module(
+    "2_systems_of_equations.banded_systems.implementation.banded_systems"
+)
+
+
 def cubic_spline(x_data: np.ndarray, y_data: np.ndarray) -> Callable[[float], float]:
     """Return a natural cubic spline interpolant through the given data.
 
@@ -16,7 +23,7 @@ def cubic_spline(x_data: np.ndarray, y_data: np.ndarray) -> Callable[[float], fl
         h_{i-1} M_{i-1} + 2(h_{i-1}+h_i) M_i + h_i M_{i+1}
             = 6 [(y_{i+1}-y_i)/h_i - (y_i-y_{i-1})/h_{i-1}]
 
-    via the Thomas algorithm, after which each piece is evaluated as
+    with the shared O(n) tridiagonal solver, after which each piece is evaluated as
 
         S_i(x) = M_i/(6h_i)(x_{i+1}-x)³ + M_{i+1}/(6h_i)(x-x_i)³
                + (y_i - M_i h_i²/6)(x_{i+1}-x)/h_i
@@ -46,26 +53,13 @@ def cubic_spline(x_data: np.ndarray, y_data: np.ndarray) -> Callable[[float], fl
     h = np.diff(x_data)
 
     # RHS of the tridiagonal system (coefficient is 6, not 3)
-    alpha = np.zeros(n)
-    for i in range(1, n - 1):
-        alpha[i] = 6 * (
-            (y_data[i + 1] - y_data[i]) / h[i]
-            - (y_data[i] - y_data[i - 1]) / h[i - 1]
-        )
-
-    # Thomas algorithm — forward sweep
-    l = np.ones(n)
-    mu = np.zeros(n)
-    z = np.zeros(n)
-    for i in range(1, n - 1):
-        l[i] = 2 * (x_data[i + 1] - x_data[i - 1]) - h[i - 1] * mu[i - 1]
-        mu[i] = h[i] / l[i]
-        z[i] = (alpha[i] - h[i - 1] * z[i - 1]) / l[i]
+    alpha = 6 * (np.diff(y_data[1:]) / h[1:] - np.diff(y_data[:-1]) / h[:-1])
 
-    # Back-substitution → second derivatives M_i
+    # Interior second derivatives; the natural conditions fix M_0 = M_n = 0
     M = np.zeros(n)
-    for j in range(n - 2, 0, -1):
-        M[j] = z[j] - mu[j] * M[j + 1]
+    M[1:-1] = _banded_systems.solve_tridiagonal(
+        h[1:-1], 2 * (h[:-1] + h[1:]), h[1:-1], alpha
+    )
 
     def spline(X: float) -> float:
         if X < x_data[0] or X > x_data[-1]:
@@ -1,5 +1,6 @@
 import numpy as np
-from numpy.linalg import LinAlgError
+from scipy.linalg import qr_multiply, solve_triangular
+from typing import Dict, Tuple, Union
 
 
 def solve_linear_system(A: np.ndarray, b: np.ndarray) -> np.ndarray:
@@ -25,30 +26,61 @@ def solve_linear_system(A: np.ndarray, b: np.ndarray) -> np.ndarray:
     return x
 
 
-def least_squares(A: np.ndarray, b: np.ndarray) -> np.ndarray:
+def _inverse_norm_estimate(R: np.ndarray) -> float:
+    """Hager/Higham estimate of ||R^-1||_1 for upper-triangular R in O(n^2)."""
+    n = R.shape[0]
+    x = np.full(n, 1.0 / n)
+    estimate = 0.0
+    for _ in range(5):
+        y = solve_triangular(R, x)
+        estimate = np.abs(y).sum()
+        z = solve_triangular(R, np.where(y >= 0, 1.0, -1.0), trans="T")
+        j = np.argmax(np.abs(z))
+        if np.abs(z[j]) <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+    # Higham's extra test vector guards against the rare underestimates
+    alternating = (-1.0) ** np.arange(n) * (1 + np.arange(n) / max(n - 1, 1))
+    return max(estimate, 2 * np.abs(solve_triangular(R, alternating)).sum() / (3 * n))
+
+
+def least_squares(
+    A: np.ndarray, b: np.ndarray, return_info: bool = False
+) -> Union[np.ndarray, Tuple[np.ndarray, Dict[str, float]]]:
+    """
+    Minimize ||A x - b||_2 through one QR factorization with column pivoting.
+
+    A P = Q R is computed without forming Q, which is applied to b directly;
+    b may be a vector or an (m, k) block of right-hand sides.
+    With column pivoting the diagonal of R decreases in magnitude, so the
+    numerical rank is read off R; A must have full column rank. With
+    return_info=True the rank and a Hager/Higham estimate of the 1-norm
+    condition number of R (which shares the 2-norm condition number of A)
+    are also returned.
+    """
     if A.ndim != 2 or A.shape[0] < A.shape[1]:
         raise ValueError("Matrix A must have at least as many rows as columns.")
+    if A.shape[1] == 0:
+        raise ValueError("Matrix A must have at least one column.")
     if A.shape[0] != b.shape[0]:
         raise ValueError("The number of rows in A must match the size of vector b.")
-    if np.any(np.all(A == 0, axis=1)):
-        raise ValueError("Matrix A contains zero rows.")
-    if np.linalg.matrix_rank(A) < A.shape[1]:
-        raise ValueError("Matrix A does not have full column rank.")
     A = A.astype(float)
     b = b.astype(float)
-    At = A.T
-    AtA = At @ A
-    Atb = At @ b
-    try:
-        # Use the normal equations explicitly to keep the implementation educational,
-        # even though solving from A directly is usually more numerically stable.
-        U, s, Vt = np.linalg.svd(AtA, full_matrices=False)
-        tol = max(AtA.shape) * np.finfo(s.dtype).eps * max(s)
-        s_inv = np.where(s > tol, 1 / s, 0.0)
-        AtA_pseudo_inv = Vt.T @ (s_inv[:, np.newaxis] * U.T)
-        x = AtA_pseudo_inv @ Atb
-    except LinAlgError:
-        raise ValueError(
-            "Singular matrix encountered during least squares computation."
-        )
+    n = A.shape[1]
+    # mode="right" forms c Q, so a block of right-hand sides goes in as b^T
+    c = b.T if b.ndim == 2 else b
+    Qtb, R, P = qr_multiply(A, c, mode="right", pivoting=True, overwrite_a=True)
+    if b.ndim == 2:
+        Qtb = Qtb.T
+    diagonal = np.abs(np.diag(R))
+    tol = max(A.shape) * np.finfo(float).eps * diagonal[0]
+    rank = int(np.count_nonzero(diagonal > tol))
+    if rank < n:
+        raise ValueError("Matrix A does not have full column rank.")
+    x = np.empty((n,) + b.shape[1:])
+    x[P] = solve_triangular(R, Qtb)
+    if return_info:
+        condition = np.abs(R).sum(axis=0).max() * _inverse_norm_estimate(R)
+        return x, {"rank": rank, "condition_number": float(condition)}
     return x
@@ -42,6 +42,11 @@ def test_least_squares_non_square():
         least_squares(A, b)
 
 
+def test_least_squares_no_columns():
+    with pytest.raises(ValueError):
+        least_squares(np.empty((3, 0)), np.ones(3))
+
+
 def test_least_squares_zero_vector():
     A = np.array([[1, 2], [3, 4]])
     b = np.array([0, 0])
@@ -111,10 +116,11 @@ def test_least_squares_inconsistent_system():
 
 
 def test_least_squares_zero_rows():
+    # A zero row carries no information but leaves A with full column rank
     A = np.array([[1, 2], [0, 0], [3, 4]])
     b = np.array([5, 0, 11])
-    with pytest.raises(ValueError):
-        least_squares(A, b)
+    x = least_squares(A, b)
+    assert np.allclose(x, [1.0, 2.0])
 
 
 def test_least_squares_exact_match():
@@ -139,3 +145,36 @@ def test_least_squares_highly_correlated():
     x = least_squares(A, b)
     expected = np.linalg.lstsq(A, b, rcond=None)[0]
     assert np.allclose(x, expected, atol=0.1)
+
+
+def test_least_squares_info():
+    rng = np.random.default_rng(0)
+    A = rng.standard_normal((200, 8)) @ np.diag(np.logspace(0, -6, 8))
+    b = rng.standard_normal(200)
+    x, info = least_squares(A, b, return_info=True)
+    assert np.allclose(x, np.linalg.lstsq(A, b, rcond=None)[0])
+    assert info["rank"] == 8
+    R = np.linalg.qr(A, mode="r")
+    exact = np.linalg.norm(R, 1) * np.linalg.norm(np.linalg.inv(R), 1)
+    assert exact / 3 <= info["condition_number"] <= exact * (1 + 1e-8)
+    # 1- and 2-norm condition numbers agree to within a factor n
+    cond_2 = np.linalg.cond(A)
+    assert cond_2 / 8 <= info["condition_number"] <= 8 * cond_2
+
+
+def test_least_squares_rank_deficient_tall():
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((50, 4))
+    A[:, 3] = A[:, 0] - 2 * A[:, 2]
+    with pytest.raises(ValueError):
+        least_squares(A, rng.standard_normal(50))
+
+
+def test_least_squares_multiple_right_hand_sides():
+    rng = np.random.default_rng(2)
+    A = rng.standard_normal((40, 5))
+    B = rng.standard_normal((40, 3))
+    X = least_squares(A, B)
+    assert X.shape == (5, 3)
+    assert np.allclose(X, np.linalg.lstsq(A, B, rcond=None)[0])
+    assert np.allclose(least_squares(A, B[:, 1]), X[:, 1])
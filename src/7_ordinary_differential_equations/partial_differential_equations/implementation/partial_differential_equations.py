@@ -1,7 +1,14 @@
 import numpy as np
+import importlib
 from typing import Callable, Tuple
 
 
+# Category packages start with a digit, so they are imported by name.
+_banded_systems = importlib.import_module(
+    "2_systems_of_equations.banded_systems.implementation.banded_systems"
+)
+
+
 def heat_equation_explicit(
     u0: np.ndarray,
     x: np.ndarray,
@@ -75,19 +82,16 @@ def heat_equation_implicit(
     u[0] = u0.copy()
 
     interior = nx - 2
-    A = np.zeros((interior, interior))
-    for i in range(interior):
-        A[i, i] = 1 + 2 * r
-        if i > 0:
-            A[i, i - 1] = -r
-        if i < interior - 1:
-            A[i, i + 1] = -r
+    off_diagonal = np.full(interior - 1, -r)
+    factors = _banded_systems.tridiagonal_factor(
+        off_diagonal, np.full(interior, 1 + 2 * r), off_diagonal
+    )
 
     for n in range(n_steps):
         b = u[n, 1:-1].copy()
         b[0] += r * bc_left
         b[-1] += r * bc_right
-        u[n + 1, 1:-1] = np.linalg.solve(A, b)
+        u[n + 1, 1:-1] = _banded_systems.tridiagonal_solve(factors, b)
         u[n + 1, 0] = bc_left
         u[n + 1, -1] = bc_right
 